@@ -24,9 +24,11 @@ import configparser
 import contextlib
 import ctypes
 import datetime
+import functools
 import io
 import json
-import math
+import logging
+import logging.handlers
 import os
 import pathlib
 import queue
@@ -36,15 +38,17 @@ import sys
 import threading
 import time
 import tkinter.font as tkFont
+import types
 import urllib.request
 import webbrowser
+from collections.abc import Iterator
+from operator import itemgetter
 from typing import IO, Any, cast
 
 import av
 import numpy as np
 import psutil  # type: ignore
 import PySimpleGUI as sg  # type: ignore
-from PIL import Image
 from wakepy import keep
 
 if sys.platform == "win32":
@@ -56,10 +60,16 @@ else:
 
 from _version import __version__
 
-
 # -- Save errors to log file ---
-def log_error(message: str, log_name: str = "error_log.txt") -> str:
-    """Logs error messages to a platform-appropriate log file location."""
+_error_loggers: dict[str, tuple[logging.Logger, str]] = {}
+
+
+def _get_error_logger(log_name: str) -> tuple[logging.Logger, str]:
+    """Lazily creates a rotating-file logger per log name and caches it."""
+    cached = _error_loggers.get(log_name)
+    if cached is not None:
+        return cached
+
     portable_flag = os.path.join(APP_DIR, 'portable_mode.txt')
 
     if os.path.exists(portable_flag):
@@ -77,10 +87,20 @@ def log_error(message: str, log_name: str = "error_log.txt") -> str:
     os.makedirs(log_dir, exist_ok=True)
 
     log_path = os.path.join(log_dir, log_name)
-    timestamp = datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(f"{timestamp} {message}\n")
+    logger = logging.getLogger(f"videocr.{log_name}")
+    logger.propagate = False
+    handler = logging.handlers.RotatingFileHandler(log_path, maxBytes=1_048_576, backupCount=3, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+    logger.addHandler(handler)
 
+    _error_loggers[log_name] = (logger, log_path)
+    return logger, log_path
+
+
+def log_error(message: str, log_name: str = "error_log.txt") -> str:
+    """Logs error messages to a platform-appropriate log file location."""
+    logger, log_path = _get_error_logger(log_name)
+    logger.error(message)
     return log_path
 
 
@@ -284,9 +304,12 @@ PADDLEOCR_LANGUAGES_LIST = [
     ('Uyghur', 'ug'), ('Uzbek', 'uz'), ('Vietnamese', 'vi'), ('Welsh', 'cy'),
     ('Sakha', 'sah'),
 ]
-PADDLEOCR_LANGUAGES_LIST.sort(key=lambda x: x[0])
-paddle_display_names = [lang[0] for lang in PADDLEOCR_LANGUAGES_LIST]
-paddle_abbr_lookup = {name: abbr for name, abbr in PADDLEOCR_LANGUAGES_LIST}
+PADDLEOCR_LANGUAGES_LIST.sort(key=itemgetter(0))
+paddle_display_names, _ = zip(*PADDLEOCR_LANGUAGES_LIST)
+paddle_abbr_lookup = dict(PADDLEOCR_LANGUAGES_LIST)
+# Reverse lookup (abbr -> display name); built over the reversed list so the
+# first entry wins when two display names share a code.
+paddle_name_lookup = {abbr: name for name, abbr in reversed(PADDLEOCR_LANGUAGES_LIST)}
 
 GOOGLE_LENS_LANGUAGES_LIST = [
     ("Afrikaans", "af"), ("Albanian", "sq"), ("Arabic", "ar"), ("Armenian", "hy"),
@@ -348,9 +371,10 @@ GOOGLE_LENS_LANGUAGES_LIST = [
     ("Venda", "ve"), ("Votic", "vot"), ("Western Frisian", "fy"), ("Wolof", "wo"),
     ("Xhosa", "xh"), ("Yoruba", "yo"), ("Zapotec", "zap")
 ]
-GOOGLE_LENS_LANGUAGES_LIST.sort(key=lambda x: x[0])
-lens_display_names = [lang[0] for lang in GOOGLE_LENS_LANGUAGES_LIST]
-lens_abbr_lookup = {name: abbr for name, abbr in GOOGLE_LENS_LANGUAGES_LIST}
+GOOGLE_LENS_LANGUAGES_LIST.sort(key=itemgetter(0))
+lens_display_names, _ = zip(*GOOGLE_LENS_LANGUAGES_LIST)
+lens_abbr_lookup = dict(GOOGLE_LENS_LANGUAGES_LIST)
+lens_name_lookup = {abbr: name for name, abbr in reversed(GOOGLE_LENS_LANGUAGES_LIST)}
 
 OCR_ENGINES = [
     'PaddleOCR (Det. + Rec.)',
@@ -498,6 +522,49 @@ def get_available_languages() -> dict[str, str]:
     return langs if langs else {'English': 'en'}
 
 
+# Frequently used event-loop strings resolved once per language change so hot
+# paths read plain attributes instead of calling LANG.get per event.
+_L = types.SimpleNamespace()
+
+
+def _refresh_lang_cache() -> None:
+    """Rebuilds the cached hot-path strings from the current LANG dictionary."""
+    _L.btn_pause = LANG.get('btn_pause', "Pause")
+    _L.btn_resume = LANG.get('btn_resume', "Resume")
+    _L.btn_start_queue = LANG.get('btn_start_queue', "Start Queue")
+    _L.status_pausing = LANG.get('status_pausing', "\nPausing process...\n")
+    _L.status_resuming = LANG.get('status_resuming', "\nResuming process...\n")
+    _L.status_cancelling = LANG.get('status_cancelling', "\nCancelling process...\n")
+    _L.status_cancelled = LANG.get('status_cancelled', "\nProcess cancelled by user.\n")
+    _L.error_cancel = LANG.get('error_cancel', "\nError attempting to cancel process: {}\n")
+    _L.error_no_process_to_cancel = LANG.get('error_no_process_to_cancel', "\nNo process is currently running to cancel.\n")
+    _L.time_text_empty = LANG.get('time_text_empty', 'Time: -/-')
+    _L.time_text_format = LANG.get('time_text_format', 'Time: {} / {}')
+    _L.crop_zone_text = LANG.get('crop_zone_text', "Zone")
+
+
+_refresh_lang_cache()
+
+# File dialog filter tuples depend on LANG; they are rebuilt on every language change
+# so the dialog handlers can reuse them without per-invocation lookups.
+_dialog_filetypes: dict[str, tuple[tuple[str, str], ...]] = {}
+
+
+def _refresh_dialog_filetypes() -> None:
+    """Rebuilds the cached language-dependent file dialog filters."""
+    _dialog_filetypes['video_open'] = (
+        (LANG.get('video_file_types', "Video Files"), "*.mp4 *.avi *.mkv *.mov *.webm *.flv *.wmv *.ts *.m2ts"),
+        (LANG.get('all_file_types', "All Files"), "*.*"),
+    )
+    _dialog_filetypes['save_as'] = (
+        (LANG.get('save_as_filter_name', "SubRip Subtitle"), "*.srt"),
+        (LANG.get('save_as_all_files', "All Files"), "*.*"),
+    )
+
+
+_refresh_dialog_filetypes()
+
+
 def load_language(lang_code: str) -> None:
     """Loads a language JSON file into a dictionary. Falls back to 'en'."""
     global LANG
@@ -522,6 +589,8 @@ def load_language(lang_code: str) -> None:
             sys.exit()
 
     LANG = loaded
+    _refresh_lang_cache()
+    _refresh_dialog_filetypes()
 
 
 def update_gui_text(window: sg.Window, is_paused: bool = False) -> None:
@@ -703,9 +772,23 @@ def kill_process_tree(pid: int) -> None:
             log_error(f"An unexpected error occurred during process kill: {e}")
 
 
-def format_time(seconds: float | int) -> str:
-    """Formats total seconds into HH:MM:SS or MM:SS string."""
-    seconds = int(seconds)
+def floor_int(value: float) -> int:
+    """Floor of a non-negative value via floor division, avoiding the math module call."""
+    return int(value // 1)
+
+
+def ceil_int(value: float) -> int:
+    """Ceiling of a non-negative value via floor division, avoiding the math module call."""
+    return int(-(-value // 1))
+
+
+def clamp(value: float, lo: float, hi: float) -> float:
+    """Clamps value to [lo, hi] in a single comparison chain instead of nested max(min(...)) calls."""
+    return lo if value < lo else hi if value > hi else value
+
+
+@functools.lru_cache(maxsize=256)
+def _format_time_cached(seconds: int) -> str:
     h = seconds // 3600
     m = (seconds % 3600) // 60
     s = seconds % 60
@@ -715,6 +798,15 @@ def format_time(seconds: float | int) -> str:
         return f"{m:02d}:{s:02d}"
 
 
+def format_time(seconds: float | int) -> str:
+    """Formats total seconds into HH:MM:SS or MM:SS string.
+
+    Cached per whole second: during scrubbing this runs on every slider tick
+    and the total-duration half of the display never changes.
+    """
+    return _format_time_cached(int(seconds))
+
+
 def format_seconds(seconds: float | int | None) -> str:
     """Converts seconds to '1h 05m' or '05m 30s' format."""
     if seconds is None or seconds < 0:
@@ -728,16 +820,16 @@ def format_seconds(seconds: float | int | None) -> str:
 
 def update_time_display(window: sg.Window, current_ms: float, total_ms: float) -> None:
     """Updates the time text elements."""
-    time_text_format = LANG.get('time_text_format', 'Time: {} / {}')
-
     if total_ms > 0:
-        current_sec = current_ms / 1000.0
-        total_sec = total_ms / 1000.0
-        time_text = f"{format_time(current_sec)} / {format_time(total_sec)}"
-        window["-TIME_TEXT-"].update(time_text_format.format(time_text))
+        time_text = f"{format_time(current_ms / 1000.0)} / {format_time(total_ms / 1000.0)}"
+        TIME_TEXT_ELEM.update(_L.time_text_format.format(time_text))
     else:
-        time_text_empty = LANG.get('time_text_empty', 'Time: -/-')
-        window["-TIME_TEXT-"].update(time_text_empty)
+        TIME_TEXT_ELEM.update(_L.time_text_empty)
+
+
+# MM:SS or HH:MM:SS; digit-only groups so the int() calls below can never raise.
+# Whitespace around each number stays accepted, as int() used to tolerate it.
+_TIME_PATTERN = re.compile(r"(?:\s*(\d+)\s*:)?\s*(\d+)\s*:\s*(\d+)\s*")
 
 
 def _parse_and_validate_time_parts(time_str: str | None) -> tuple[int, int, int] | None:
@@ -745,26 +837,22 @@ def _parse_and_validate_time_parts(time_str: str | None) -> tuple[int, int, int]
     if not time_str:
         return None
 
-    parts = time_str.split(':')
-    try:
-        if len(parts) == 2:
-            m = int(parts[0])
-            s = int(parts[1])
-            if m < 0 or s < 0 or s >= 60:
-                return None
-            return (0, m, s)
-        elif len(parts) == 3:
-            h = int(parts[0])
-            m = int(parts[1])
-            s = int(parts[2])
-            if h < 0 or m < 0 or s < 0 or m >= 60 or s >= 60:
-                return None
-            return (h, m, s)
-        else:
-            return None
-    except ValueError:
+    match = _TIME_PATTERN.fullmatch(time_str)
+    if not match:
+        return None
+
+    h_str, m_str, s_str = match.groups()
+    h = int(h_str) if h_str else 0
+    m = int(m_str)
+    s = int(s_str)
+
+    # Seconds are always capped; minutes only in the HH:MM:SS form, since plain
+    # MM:SS deliberately accepts values like 90:30.
+    if s >= 60 or (h_str is not None and m >= 60):
         return None
 
+    return (h, m, s)
+
 
 def is_valid_time_format(time_str: str | None) -> bool:
     """Checks if a string is in MM:SS or HH:MM:SS format with valid ranges."""
@@ -1029,6 +1117,133 @@ def update_gui_scaling_combo(window: sg.Window, selected_index: int | None = Non
         window['gui_scaling'].update(value=display_val, values=translated_names)
 
 
+@contextlib.contextmanager
+def batched_updates(window: sg.Window) -> Any:
+    """Records element updates and flushes them in a single pass.
+
+    Branches that touch many widgets at once (pause/resume, queue finished)
+    record their updates through the yielded function; the updates are applied
+    together at exit followed by one idle-task pass instead of letting Tk
+    process each reconfiguration separately.
+    """
+    pending: dict[str, dict[str, Any]] = {}
+
+    def update(key: str, **kwargs: Any) -> None:
+        pending.setdefault(key, {}).update(kwargs)
+
+    yield update
+
+    for key, kwargs in pending.items():
+        window[key].update(**kwargs)
+    window.TKroot.update_idletasks()
+
+
+def update_if_changed(element: sg.Element, value: Any) -> None:
+    """Pushes a value into an element only when it differs from the current one.
+
+    Skipping no-op updates avoids a Tk widget reconfiguration per call; values
+    are also compared as strings since Inputs return text for numeric settings.
+    """
+    try:
+        current = element.get()
+    except Exception:
+        current = None
+
+    if current != value and str(current) != str(value):
+        element.update(value)
+
+
+class OutputLog:
+    """Batches appends to the '-OUTPUT-' log into one Tk insert per interval.
+
+    Each append on a Multiline is an insert plus an auto-scroll; under heavy
+    worker output that means hundreds of widget operations per second. Writes
+    are buffered and flushed together from a Tk after() callback instead.
+    """
+
+    def __init__(self, window: sg.Window, interval_ms: int = 50) -> None:
+        self.window = window
+        self.output_elem = window['-OUTPUT-']
+        self.interval_ms = interval_ms
+        self.buffer: list[str] = []
+        self._flush_scheduled = False
+
+    def write(self, text: str) -> None:
+        self.buffer.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.window.TKroot.after(self.interval_ms, self.flush)
+
+    def flush(self) -> None:
+        self._flush_scheduled = False
+        if self.buffer and not self.window.was_closed():
+            text = ''.join(self.buffer)
+            self.buffer.clear()
+            self.output_elem.update(text, append=True)
+
+
+def format_crop_coord_text(crop_boxes: list[dict[str, Any]], use_dual_zone: bool) -> str:
+    """Builds the crop coordinate display string for the given crop boxes."""
+    if not use_dual_zone:
+        c = crop_boxes[0]['coords']
+        return f"({c['crop_x']}, {c['crop_y']}, {c['crop_width']}, {c['crop_height']})"
+
+    zone_text = _L.crop_zone_text
+    return "  |  ".join(
+        f"{zone_text} {i + 1}: ({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})"
+        for i, b in enumerate(crop_boxes)
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _path_exists_cached(path: str, bucket: int) -> bool:
+    """os.path.exists with a ~2s TTL so bursts of UI actions don't re-stat the same file."""
+    return os.path.exists(path)
+
+
+def path_exists(path: str) -> bool:
+    """Checks file existence, caching the result briefly to keep stat calls off hot UI paths."""
+    return _path_exists_cached(path, int(time.time() / 2))
+
+
+def restore_job_settings(window: sg.Window, args: dict[str, Any]) -> None:
+    """Pushes a queued job's saved arguments back into the settings widgets."""
+    window['--output'].update(args.get('output', ''))
+
+    saved_engine = args.get('ocr_engine', 'paddleocr')
+    if saved_engine == 'google_lens':
+        engine_display = OCR_ENGINES[1]
+        active_lang_list = lens_display_names
+        name_lookup = lens_name_lookup
+    else:
+        engine_display = OCR_ENGINES[0]
+        active_lang_list = paddle_display_names
+        name_lookup = paddle_name_lookup
+
+    window['-OCR_ENGINE_COMBO-'].update(value=engine_display)
+
+    saved_lang_abbr = args.get('lang', 'en')
+    disp_name = name_lookup.get(saved_lang_abbr, DEFAULT_SUBTITLE_LANGUAGE)
+    window['-LANG_COMBO-'].update(values=active_lang_list, value=disp_name)
+
+    for arg_key in args.keys() & ARG_WIDGETS.keys():
+        if arg_key in ('ocr_engine', 'lang'):
+            continue
+        update_if_changed(ARG_WIDGETS[arg_key], args[arg_key])
+
+
+def restore_crop_box(cx: float, cy: float, cw: float, ch: float, sx: float, sy: float) -> dict[str, Any]:
+    """Rebuilds a crop box dict from saved original-resolution coordinates.
+
+    Each call returns a fresh dict on purpose: crop boxes are mutated in place
+    by the resize handlers, so the results must never be cached or shared.
+    """
+    return {
+        'coords': {'crop_x': int(cx), 'crop_y': int(cy), 'crop_width': int(cw), 'crop_height': int(ch)},
+        'img_points': ((cx * sx, cy * sy), ((cx + cw) * sx, (cy + ch) * sy))
+    }
+
+
 def get_translated_status(internal_status: str) -> str:
     """Translates internal status codes to display language."""
     lang_key = INTERNAL_STATUS_TO_LANG_KEY.get(internal_status)
@@ -1038,44 +1253,50 @@ def get_translated_status(internal_status: str) -> str:
 
 
 # --- Settings Save/Load Functions ---
+# Single source of truth for persisted settings: (key, element type, default).
+# 'input'/'checkbox'/'combo_lang' keys go through the generic load path in
+# load_settings; 'special' keys are restored by dedicated code there.
+SETTINGS_SCHEMA: tuple[tuple[str, str, Any], ...] = (
+    ('--language', 'special', 'en'),
+    ('-OCR_ENGINE_COMBO-', 'special', DEFAULT_OCR_ENGINE),
+    ('-LANG_COMBO-', 'combo_lang', DEFAULT_SUBTITLE_LANGUAGE),
+    ('-SUBTITLE_POS_COMBO-', 'special', DEFAULT_INTERNAL_SUBTITLE_POSITION),
+    ('-POST_ACTION-', 'special', 0),
+    ('--time_start', 'input', DEFAULT_TIME_START),
+    ('--time_end', 'input', ''),
+    ('--conf_threshold', 'input', str(DEFAULT_CONF_THRESHOLD)),
+    ('--sim_threshold', 'input', str(DEFAULT_SIM_THRESHOLD)),
+    ('--max_merge_gap', 'input', str(DEFAULT_MAX_MERGE_GAP)),
+    ('--brightness_threshold', 'input', ''),
+    ('--ssim_threshold', 'input', str(DEFAULT_SSIM_THRESHOLD)),
+    ('--ocr_image_max_width', 'input', str(DEFAULT_OCR_IMAGE_MAX_WIDTH)),
+    ('--frames_to_skip', 'input', str(DEFAULT_FRAMES_TO_SKIP)),
+    ('--use_fullframe', 'checkbox', False),
+    ('--use_gpu', 'checkbox', True),
+    ('--use_angle_cls', 'checkbox', False),
+    ('--post_processing', 'checkbox', False),
+    ('--min_subtitle_duration', 'input', str(DEFAULT_MIN_SUBTITLE_DURATION)),
+    ('--use_server_model', 'checkbox', False),
+    ('--use_dual_zone', 'checkbox', False),
+    ('enable_subtitle_alignment', 'checkbox', False),
+    ('--subtitle_alignment', 'special', DEFAULT_SUBTITLE_ALIGNMENT),
+    ('--subtitle_alignment2', 'special', DEFAULT_SUBTITLE_ALIGNMENT),
+    ('--keyboard_seek_step', 'input', str(KEY_SEEK_STEP)),
+    ('--default_output_dir', 'input', DEFAULT_DOCUMENTS_DIR),
+    ('--save_in_video_dir', 'checkbox', True),
+    ('--send_notification', 'checkbox', True),
+    ('--save_crop_box', 'checkbox', True),
+    ('--saved_crop_boxes', 'special', '[]'),
+    ('--check_for_updates', 'checkbox', True),
+    ('prevent_system_sleep', 'checkbox', True),
+    ('--normalize_to_simplified_chinese', 'checkbox', True),
+    ('gui_scaling', 'special', DEFAULT_GUI_SCALING),
+)
+
+
 def get_default_settings() -> dict[str, Any]:
     """Returns a dictionary of default settings."""
-    return {
-    '--language': 'en',
-    '-OCR_ENGINE_COMBO-': DEFAULT_OCR_ENGINE,
-    '-LANG_COMBO-': DEFAULT_SUBTITLE_LANGUAGE,
-    '-SUBTITLE_POS_COMBO-': DEFAULT_INTERNAL_SUBTITLE_POSITION,
-    '-POST_ACTION-': 0,
-    '--time_start': DEFAULT_TIME_START,
-    '--time_end': '',
-    '--conf_threshold': str(DEFAULT_CONF_THRESHOLD),
-    '--sim_threshold': str(DEFAULT_SIM_THRESHOLD),
-    '--max_merge_gap': str(DEFAULT_MAX_MERGE_GAP),
-    '--brightness_threshold': '',
-    '--ssim_threshold': str(DEFAULT_SSIM_THRESHOLD),
-    '--ocr_image_max_width': str(DEFAULT_OCR_IMAGE_MAX_WIDTH),
-    '--frames_to_skip': str(DEFAULT_FRAMES_TO_SKIP),
-    '--use_fullframe': False,
-    '--use_gpu': True,
-    '--use_angle_cls': False,
-    '--post_processing': False,
-    '--min_subtitle_duration': str(DEFAULT_MIN_SUBTITLE_DURATION),
-    '--use_server_model': False,
-    '--use_dual_zone': False,
-    'enable_subtitle_alignment': False,
-    '--subtitle_alignment': DEFAULT_SUBTITLE_ALIGNMENT,
-    '--subtitle_alignment2': DEFAULT_SUBTITLE_ALIGNMENT,
-    '--keyboard_seek_step': str(KEY_SEEK_STEP),
-    '--default_output_dir': DEFAULT_DOCUMENTS_DIR,
-    '--save_in_video_dir': True,
-    '--send_notification': True,
-    '--save_crop_box': True,
-    '--saved_crop_boxes': '[]',
-    '--check_for_updates': True,
-    'prevent_system_sleep': True,
-    '--normalize_to_simplified_chinese': True,
-    'gui_scaling': 'System Default',
-    }
+    return {key: default for key, _, default in SETTINGS_SCHEMA}
 
 
 def save_settings(window: sg.Window, values: dict[str, Any]) -> None:
@@ -1083,7 +1304,8 @@ def save_settings(window: sg.Window, values: dict[str, Any]) -> None:
     config = configparser.ConfigParser()
     config.add_section(CONFIG_SECTION)
 
-    settings_to_save = {key: values.get(key, get_default_settings().get(key)) for key in get_default_settings() if key != '--saved_crop_boxes'}
+    defaults = get_default_settings()
+    settings_to_save = {key: values.get(key, default) for key, default in defaults.items() if key != '--saved_crop_boxes'}
 
     display_name_to_internal_map = {LANG.get(lang_key, lang_key): internal_val for lang_key, internal_val in SUBTITLE_POSITIONS_LIST}
     selected_display_name = values.get('-SUBTITLE_POS_COMBO-', "")
@@ -1146,92 +1368,70 @@ def load_settings(window: sg.Window) -> None:
         try:
             config.read(CONFIG_FILE)
             if config.has_section(CONFIG_SECTION):
-                saved_lang_code = config.get(CONFIG_SECTION, '--language', fallback='en')
+                # One dict snapshot replaces per-key has_option/get dispatch.
+                # configparser lowercases option names, so lookups use
+                # lowercased keys.
+                section = dict(config[CONFIG_SECTION])
+                boolean_states = configparser.ConfigParser.BOOLEAN_STATES
+
+                saved_lang_code = section.get('--language', 'en')
                 load_language(saved_lang_code)
 
-                saved_internal_pos = config.get(CONFIG_SECTION, '-SUBTITLE_POS_COMBO-', fallback=DEFAULT_INTERNAL_SUBTITLE_POSITION)
+                saved_internal_pos = section.get('-subtitle_pos_combo-', DEFAULT_INTERNAL_SUBTITLE_POSITION)
                 update_subtitle_pos_combo(window, saved_internal_pos)
 
-                saved_idx = config.getint(CONFIG_SECTION, '-POST_ACTION-', fallback=0)
+                saved_idx = int(section.get('-post_action-', 0))
                 update_post_action_combo(window, saved_idx)
 
                 code_to_native_name_map = {v: k for k, v in available_languages.items()}
                 display_lang = code_to_native_name_map.get(saved_lang_code, 'English')
                 window['-UI_LANG_COMBO-'].update(value=display_lang)
 
-                saved_align1 = config.get(CONFIG_SECTION, '--subtitle_alignment', fallback=DEFAULT_SUBTITLE_ALIGNMENT)
-                saved_align2 = config.get(CONFIG_SECTION, '--subtitle_alignment2', fallback=DEFAULT_SUBTITLE_ALIGNMENT)
+                saved_align1 = section.get('--subtitle_alignment', DEFAULT_SUBTITLE_ALIGNMENT)
+                saved_align2 = section.get('--subtitle_alignment2', DEFAULT_SUBTITLE_ALIGNMENT)
                 update_alignment_combos(window, get_alignment_index(saved_align1), get_alignment_index(saved_align2))
 
-                saved_scaling = config.get(CONFIG_SECTION, 'gui_scaling', fallback=DEFAULT_GUI_SCALING)
+                saved_scaling = section.get('gui_scaling', DEFAULT_GUI_SCALING)
                 update_gui_scaling_combo(window, get_gui_scaling_index(saved_scaling))
 
-                saved_engine = config.get(CONFIG_SECTION, '-OCR_ENGINE_COMBO-', fallback=DEFAULT_OCR_ENGINE)
+                saved_engine = section.get('-ocr_engine_combo-', DEFAULT_OCR_ENGINE)
                 window['-OCR_ENGINE_COMBO-'].update(value=saved_engine)
 
                 active_lang_list = lens_display_names if "Google Lens" in saved_engine else paddle_display_names
                 window['-LANG_COMBO-'].update(values=active_lang_list)
 
-                settings_to_load = [
-                    ('-LANG_COMBO-', 'combo_lang'),
-                    ('--time_start', 'input'),
-                    ('--time_end', 'input'),
-                    ('--conf_threshold', 'input'),
-                    ('--sim_threshold', 'input'),
-                    ('--max_merge_gap', 'input'),
-                    ('--brightness_threshold', 'input'),
-                    ('--ssim_threshold', 'input'),
-                    ('--ocr_image_max_width', 'input'),
-                    ('--frames_to_skip', 'input'),
-                    ('--use_fullframe', 'checkbox'),
-                    ('--use_gpu', 'checkbox'),
-                    ('--use_angle_cls', 'checkbox'),
-                    ('--post_processing', 'checkbox'),
-                    ('--min_subtitle_duration', 'input'),
-                    ('--use_server_model', 'checkbox'),
-                    ('--use_dual_zone', 'checkbox'),
-                    ('enable_subtitle_alignment', 'checkbox'),
-                    ('--keyboard_seek_step', 'input'),
-                    ('--default_output_dir', 'input'),
-                    ('--save_in_video_dir', 'checkbox'),
-                    ('--send_notification', 'checkbox'),
-                    ('--save_crop_box', 'checkbox'),
-                    ('--check_for_updates', 'checkbox'),
-                    ('prevent_system_sleep', 'checkbox'),
-                    ('--normalize_to_simplified_chinese', 'checkbox'),
-                ]
-
-                for key, elem_type in settings_to_load:
-                    if config.has_option(CONFIG_SECTION, key):
-                        try:
-                            value: Any = None
-                            if elem_type == 'checkbox':
-                                value = config.getboolean(CONFIG_SECTION, key)
-                            elif elem_type == 'combo_lang':
-                                value_str = config.get(CONFIG_SECTION, key)
-                                if value_str in active_lang_list:
-                                    value = value_str
-                                else:
-                                    value = DEFAULT_SUBTITLE_LANGUAGE
-                            else:
-                                value = config.get(CONFIG_SECTION, key)
-
-                            if key in window.AllKeysDict:
-                                window[key].update(value)
-
-                        except Exception as e:
-                            log_error(f"Error loading setting '{key}' from {CONFIG_FILE}: {e}. Using default.")
-
-                saved_boxes_str = config.get(CONFIG_SECTION, '--saved_crop_boxes', fallback='[]')
+                for key, elem_type, _ in SETTINGS_SCHEMA:
+                    if elem_type == 'special':
+                        continue
+                    value_str = section.get(key.lower())
+                    if value_str is None:
+                        continue
+                    try:
+                        value: Any = value_str
+                        if elem_type == 'checkbox':
+                            value = boolean_states[value_str.lower()]
+                        elif elem_type == 'combo_lang' and value_str not in active_lang_list:
+                            value = DEFAULT_SUBTITLE_LANGUAGE
+
+                        if key in window.AllKeysDict:
+                            window[key].update(value)
+
+                    except Exception as e:
+                        log_error(f"Error loading setting '{key}' from {CONFIG_FILE}: {e}. Using default.")
+
+                saved_boxes_str = section.get('--saved_crop_boxes', '[]')
                 try:
                     window.saved_crop_boxes_from_config = ast.literal_eval(saved_boxes_str)
                 except (ValueError, SyntaxError):
                     window.saved_crop_boxes_from_config = []
                     log_error(f"Could not parse saved_crop_boxes: {saved_boxes_str}")
 
+            # A single zero-timeout read pumps all queued widget updates in one
+            # pass and collects the restored values. Writing the settings back to
+            # disk here was redundant: they were just read from the config, and
+            # every later change autosaves anyway.
             current_gui_values = window.read(timeout=0)[1]
             update_alignment_controls(window, current_gui_values)
-            save_settings(window, current_gui_values)
 
         except configparser.Error as e:
             log_error(f"Error parsing config file {CONFIG_FILE}: {e}. Creating default config.")
@@ -1259,10 +1459,36 @@ def load_settings(window: sg.Window) -> None:
             log_error(f"Error creating default config file {CONFIG_FILE}: {e}")
 
 
+@functools.lru_cache(maxsize=32)
+def _output_path_cached(video_path: str, output_dir: pathlib.Path, iso_code: str, bucket: int) -> pathlib.Path:
+    video_filename_stem = pathlib.Path(video_path).stem
+
+    # One directory listing instead of a stat per candidate name; on network
+    # drives the per-name exists() probes dominated when many numbered outputs
+    # already existed. Names are casefolded so Windows' case-insensitive
+    # filesystems cannot sneak a collision past the comparison.
+    try:
+        existing_names = {entry.name.casefold() for entry in os.scandir(output_dir)}
+    except OSError:
+        existing_names = set()
+
+    output_path = output_dir / f"{video_filename_stem}.{iso_code}.srt"
+    counter = 1
+    while output_path.name.casefold() in existing_names:
+        output_path = output_dir / f"{video_filename_stem}({counter}).{iso_code}.srt"
+        counter += 1
+
+    return output_path
+
+
 def generate_output_path(video_path: str, values: dict[str, Any], default_dir: str = DEFAULT_DOCUMENTS_DIR) -> pathlib.Path:
-    """Generates a unique output file path for the SRT file based on video path, settings and language."""
+    """Generates a unique output file path for the SRT file based on video path, settings and language.
+
+    The directory scan behind the uniqueness check is cached for ~2 s per
+    (video, directory, language) so toggling the output-location checkbox or
+    burst autosaves do not re-list the directory each time.
+    """
     video_file_path = pathlib.Path(video_path)
-    video_filename_stem = video_file_path.stem
 
     save_in_video_dir = values.get('--save_in_video_dir', True)
     if save_in_video_dir:
@@ -1283,14 +1509,22 @@ def generate_output_path(video_path: str, values: dict[str, Any], default_dir: s
         paddle_code = paddle_abbr_lookup.get(selected_lang_name, 'en')
         iso_code = PADDLE_TO_ISO_MAP.get(paddle_code, paddle_code)
 
-    base_output_path = output_dir / f"{video_filename_stem}.{iso_code}.srt"
-    output_path = base_output_path
-    counter = 1
-    while output_path.exists():
-        output_path = output_dir / f"{video_filename_stem}({counter}).{iso_code}.srt"
-        counter += 1
+    return _output_path_cached(video_path, output_dir, iso_code, int(time.time() / 2))
 
-    return output_path
+
+def _container_metadata(container: av.container.InputContainer) -> tuple[int, int, int]:
+    """Reads width/height/duration for the first video stream of an open container."""
+    stream = container.streams.video[0]
+    width, height = int(stream.width), int(stream.height)
+
+    if container.duration is not None:
+        duration_ms = int(container.duration / 1000.0)
+    elif stream.duration is not None and stream.time_base is not None:
+        duration_ms = int(stream.duration * float(stream.time_base) * 1000.0)
+    else:
+        duration_ms = 0
+
+    return width, height, duration_ms
 
 
 class VideoHandler:
@@ -1304,15 +1538,33 @@ class VideoHandler:
 
         self.last_pts: int | None = None
 
+        # Per-open seek math, resolved once in _open_locked: stream time base in
+        # seconds, container start offset in ms, and the forward-walk window in
+        # pts units within which sequential decode beats a keyframe re-seek.
+        self.time_base_s: float = 0.0
+        self.start_offset_ms: float = 0.0
+        self.seek_threshold_pts: int = 0
+
+        # Last request/result pair so repeated seeks to the same target (slider
+        # jitter) return the encoded frame without touching the decoder.
+        self._last_request: tuple[Any, ...] | None = None
+        self._last_output: tuple[bytes, int, int, int, int] | None = None
+
         self.graph: av.filter.Graph | None = None
         self.buffer_node: Any = None
         self.sink_node: Any = None
         self.last_display_size: tuple[int, int] = (0, 0)
         self.current_new_w: int = 0
         self.current_new_h: int = 0
+        self.offset_x: int = 0
+        self.offset_y: int = 0
 
         self._supports_threads = True
 
+        # Serializes open/get_frame/close between the GUI thread and the preview
+        # decode thread; reentrant because open() closes any previous container.
+        self._lock = threading.RLock()
+
     def _frame_to_array(self, frame: av.VideoFrame, fmt: str) -> np.ndarray[Any, Any]:
         """Converts a frame to an array, safely falls back if threads arg is unsupported."""
         if self._supports_threads:
@@ -1342,7 +1594,16 @@ class VideoHandler:
         self.graph.configure()
         self.last_display_size = display_size
 
+        # Centering offsets are invariant for a given video/display size pair, so
+        # they are computed here once instead of per decoded frame.
+        self.offset_x = (display_size[0] - self.current_new_w) // 2
+        self.offset_y = (display_size[1] - self.current_new_h) // 2
+
     def open(self, path: str) -> dict[str, int]:
+        with self._lock:
+            return self._open_locked(path)
+
+    def _open_locked(self, path: str) -> dict[str, int]:
         if self.path == path and self.container:
             return self._get_cached_properties()
 
@@ -1352,13 +1613,13 @@ class VideoHandler:
             self.stream = self.container.streams.video[0]
             self.stream.thread_type = 'FRAME'
             self.path = path
-            self.width = int(self.stream.width)
-            self.height = int(self.stream.height)
+            self.width, self.height, self.duration_ms = _container_metadata(self.container)
 
-            if self.container.duration is not None:
-                self.duration_ms = int(self.container.duration / 1000.0)
-            elif self.stream.duration is not None and self.stream.time_base is not None:
-                self.duration_ms = int(self.stream.duration * float(self.stream.time_base) * 1000.0)
+            if self.stream.time_base is None:
+                raise ValueError("Stream time_base is None")
+            self.time_base_s = float(self.stream.time_base)
+            self.start_offset_ms = (self.container.start_time / 1000.0) if self.container.start_time is not None else 0.0
+            self.seek_threshold_pts = int(1.5 / self.time_base_s)
 
             return self._get_cached_properties()
 
@@ -1369,22 +1630,25 @@ class VideoHandler:
 
     def get_frame(self, timestamp_ms: float, display_size: tuple[int, int], brightness_threshold: int | None = None) -> tuple[io.BytesIO | None, int, int, int, int]:
         """Seeks or decodes forward to provide a frame at the requested timestamp."""
+        with self._lock:
+            return self._get_frame_locked(timestamp_ms, display_size, brightness_threshold)
+
+    def _get_frame_locked(self, timestamp_ms: float, display_size: tuple[int, int], brightness_threshold: int | None) -> tuple[io.BytesIO | None, int, int, int, int]:
         if not self.container or not self.stream:
             return None, 0, 0, 0, 0
 
         try:
-            if self.stream.time_base is None:
-                raise ValueError("Stream time_base is None")
+            target_ms = timestamp_ms + self.start_offset_ms
+            target_pts = int(target_ms / 1000.0 / self.time_base_s)
 
-            tb = float(self.stream.time_base)
-            container_start_ms = (self.container.start_time / 1000.0) if self.container.start_time is not None else 0.0
-            target_ms = timestamp_ms + container_start_ms
-            target_pts = int(target_ms / 1000.0 / tb)
-            seek_threshold = int(1.5 / tb)
+            request_key = (self.path, target_pts, display_size, brightness_threshold)
+            if request_key == self._last_request and self._last_output is not None:
+                frame_bytes, res_w, res_h, off_x, off_y = self._last_output
+                return io.BytesIO(frame_bytes), res_w, res_h, off_x, off_y
 
             should_seek = True
             if self.last_pts is not None:
-                if self.last_pts <= target_pts <= (self.last_pts + seek_threshold):
+                if self.last_pts <= target_pts <= (self.last_pts + self.seek_threshold_pts):
                     should_seek = False
 
             if should_seek:
@@ -1404,8 +1668,8 @@ class VideoHandler:
             if self.graph is None or self.last_display_size != display_size:
                 self._setup_filter_graph(frame, display_size)
 
-            off_x = (display_size[0] - self.current_new_w) // 2
-            off_y = (display_size[1] - self.current_new_h) // 2
+            off_x = self.offset_x
+            off_y = self.offset_y
 
             self.buffer_node.push(frame)
             processed_frame: av.VideoFrame = self.sink_node.pull()
@@ -1421,11 +1685,16 @@ class VideoHandler:
                 mask = gray > brightness_threshold
                 img_np *= mask[..., None]
 
-            pil_img = Image.fromarray(img_np)
-            img_byte_arr = io.BytesIO()
-            pil_img.save(img_byte_arr, format='PNG')
+            # PPM is just a text header plus raw RGB bytes and Tk reads it
+            # natively, so the frame goes to the canvas without any encoder
+            # pass or intermediate PIL image.
+            frame_h, frame_w = img_np.shape[:2]
+            frame_bytes = b"P6\n%d %d\n255\n" % (frame_w, frame_h) + img_np.tobytes()
+
+            self._last_request = request_key
+            self._last_output = (frame_bytes, self.current_new_w, self.current_new_h, off_x, off_y)
 
-            return io.BytesIO(img_byte_arr.getvalue()), self.current_new_w, self.current_new_h, off_x, off_y
+            return io.BytesIO(frame_bytes), self.current_new_w, self.current_new_h, off_x, off_y
 
         except Exception as e:
             log_error(f"VideoHandler Seek Error: {e}")
@@ -1433,13 +1702,82 @@ class VideoHandler:
 
     def close(self) -> None:
         """Closes the video container and resets all persistent objects and cached metadata."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
         if self.container:
             self.container.close()
         self.container = self.stream = self.path = self.graph = self.buffer_node = self.sink_node = None
+        self.last_pts = None
+        self._last_request = None
+        self._last_output = None
         self.width = self.height = 0
         self.duration_ms = 0
         self.last_display_size = (0, 0)
         self.current_new_w = self.current_new_h = 0
+        self.offset_x = self.offset_y = 0
+        self.time_base_s = self.start_offset_ms = 0.0
+        self.seek_threshold_pts = 0
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_video_cached(path: str, mtime: float) -> tuple[int, int, int]:
+    """Parses container metadata for a (path, mtime) pair; cached across calls."""
+    try:
+        with av.open(path) as container:
+            return _container_metadata(container)
+
+    except (av.error.FFmpegError, Exception) as e:
+        log_error(f"Video probe error: {e}")
+        return 0, 0, 0
+
+
+def probe_video(path: str) -> dict[str, int]:
+    """Returns video metadata without opening a decoder, re-parsing only when the file changes.
+
+    Metadata-only callers (queue validation, batch scanning) use this instead of
+    VideoHandler.open so they neither pay a container parse per call nor disturb
+    the handler's currently loaded video.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {'width': 0, 'height': 0, 'duration_ms': 0}
+
+    width, height, duration_ms = _probe_video_cached(path, mtime)
+    return {'width': width, 'height': height, 'duration_ms': duration_ms}
+
+
+FIRST_FRAME_CACHE_SIZE = 16
+first_frame_cache: dict[tuple[Any, ...], tuple[bytes, int, int, int, int]] = {}
+
+
+def get_first_frame(handler: VideoHandler, path: str, display_size: tuple[int, int], brightness_threshold: int | None = None) -> tuple[io.BytesIO | None, int, int, int, int]:
+    """Returns the first frame of a video, serving repeated requests from a small cache.
+
+    Entries are keyed on the file's mtime so an overwritten video is decoded
+    again instead of showing a stale preview.
+    """
+    try:
+        mtime: float | None = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+
+    key = (path, mtime, display_size, brightness_threshold)
+    cached = first_frame_cache.get(key) if mtime is not None else None
+    if cached is not None:
+        frame_bytes, res_w, res_h, off_x, off_y = cached
+        return io.BytesIO(frame_bytes), res_w, res_h, off_x, off_y
+
+    img_bytes, res_w, res_h, off_x, off_y = handler.get_frame(0, display_size, brightness_threshold=brightness_threshold)
+
+    if img_bytes is not None and mtime is not None:
+        if len(first_frame_cache) >= FIRST_FRAME_CACHE_SIZE:
+            first_frame_cache.pop(next(iter(first_frame_cache)))
+        first_frame_cache[key] = (img_bytes.getvalue(), res_w, res_h, off_x, off_y)
+
+    return img_bytes, res_w, res_h, off_x, off_y
 
 
 def handle_progress(match: re.Match[str], label_format_key: str, last_percentage: float, log_threshold: int, step_num: int, show_taskbar_progress: bool = True) -> float:
@@ -1499,8 +1837,15 @@ def handle_progress(match: re.Match[str], label_format_key: str, last_percentage
     time_delta = current_time - handle_progress.last_update_time  # type: ignore
     percent_threshold = last_percentage + 0.1
 
+    # Rate-limit posts to roughly 10/sec: the percent threshold alone can fire
+    # for every processed image on fast OCR runs and flood the GUI queue. The
+    # 100 % update always goes through so the bar never finishes short.
     should_update = False
-    if current_percent >= 100 or current_percent >= percent_threshold or time_delta >= 0.2:
+    if current_percent >= 100:
+        should_update = True
+    elif time_delta >= 0.2:
+        should_update = True
+    elif current_percent >= percent_threshold and time_delta >= 0.1:
         should_update = True
 
     if not should_update:
@@ -1567,10 +1912,10 @@ def handle_progress(match: re.Match[str], label_format_key: str, last_percentage
     return current_percent
 
 
-def read_pipe(pipe: IO[str], output_list: list[str]) -> None:
-    """Reads lines from a pipe and appends them to a list."""
+def read_pipe(pipe: IO[bytes], output_list: list[bytes]) -> None:
+    """Reads raw lines from a pipe and appends them to a list."""
     try:
-        for line in iter(pipe.readline, ''):
+        for line in iter(pipe.readline, b''):
             output_list.append(line)
     finally:
         pipe.close()
@@ -1591,6 +1936,26 @@ def scan_video_folder(folder_path: str) -> list[str]:
 
 
 # --- Argument Extraction and Validation ---
+# Numeric input validation table: (key, cast, min, max, display name).
+NUMERIC_PARAMS = (
+    ('--conf_threshold', int, 0, 100, "Confidence Threshold"),
+    ('--sim_threshold', int, 0, 100, "Similarity Threshold"),
+    ('--brightness_threshold', int, 0, 255, "Brightness Threshold"),
+    ('--ssim_threshold', int, 0, 100, "SSIM Threshold"),
+    ('--ocr_image_max_width', int, 0, None, "Max OCR Image Width"),
+    ('--frames_to_skip', int, 0, None, "Frames to Skip"),
+    ('--max_merge_gap', float, 0.0, None, "Max Merge Gap"),
+    ('--min_subtitle_duration', float, 0.0, None, "Minimum Subtitle Duration"),
+)
+
+# '--' keys that are GUI-only settings and never forwarded to the CLI.
+CLI_EXCLUDED_ARG_KEYS = frozenset((
+    '--keyboard_seek_step', '--default_output_dir', '--save_in_video_dir',
+    '--send_notification', '--save_crop_box', '--check_for_updates',
+    '--language', '--use_dual_zone', '--subtitle_alignment', '--subtitle_alignment2',
+))
+
+
 def get_processing_args(values: dict[str, Any], window: sg.Window) -> tuple[dict[str, Any] | None, list[str] | None]:
     """
     Validates inputs and generates the argument dictionary for the CLI.
@@ -1629,18 +1994,7 @@ def get_processing_args(values: dict[str, Any], window: sg.Window) -> tuple[dict
     if use_dual_zone and len(window.crop_boxes) != 2:
         errors.append(LANG.get('val_err_dual_zone', "Dual Zone OCR is enabled, but 2 crop boxes have not been selected."))
 
-    numeric_params = {
-        '--conf_threshold': (int, 0, 100, "Confidence Threshold"),
-        '--sim_threshold': (int, 0, 100, "Similarity Threshold"),
-        '--brightness_threshold': (int, 0, 255, "Brightness Threshold"),
-        '--ssim_threshold': (int, 0, 100, "SSIM Threshold"),
-        '--ocr_image_max_width': (int, 0, None, "Max OCR Image Width"),
-        '--frames_to_skip': (int, 0, None, "Frames to Skip"),
-        '--max_merge_gap': (float, 0.0, None, "Max Merge Gap"),
-        '--min_subtitle_duration': (float, 0.0, None, "Minimum Subtitle Duration"),
-    }
-
-    for key, (cast_type, min_val, max_val, name) in numeric_params.items():
+    for key, cast_type, min_val, max_val, name in NUMERIC_PARAMS:
         value_str = values.get(key, '').strip()
 
         if not value_str:
@@ -1688,14 +2042,12 @@ def get_processing_args(values: dict[str, Any], window: sg.Window) -> tuple[dict
     if pos_value:
         args['subtitle_position'] = pos_value
 
-    for key in values:
-        if key.startswith('--') and key not in ['--keyboard_seek_step', '--default_output_dir', '--save_in_video_dir', '--send_notification', '--save_crop_box', '--check_for_updates', '--language', '--use_dual_zone', '--subtitle_alignment', '--subtitle_alignment2']:
-            stripped_key = key.lstrip('-')
-            value = values.get(key)
-            if isinstance(value, bool):
-                args[stripped_key] = value
-            elif value is not None and str(value).strip() != '':
-                args[stripped_key] = str(value).strip()
+    for key, arg_name in CLI_ARG_KEY_MAP.items():
+        raw_value = values.get(key)
+        if isinstance(raw_value, bool):
+            args[arg_name] = raw_value
+        elif raw_value is not None and str(raw_value).strip() != '':
+            args[arg_name] = str(raw_value).strip()
 
     # Conditionally add subtitle alignment args if the feature is enabled
     if values.get('enable_subtitle_alignment'):
@@ -1750,6 +2102,50 @@ def get_valid_brightness_threshold(value: Any) -> int | None:
     return None
 
 
+# CLI output patterns, compiled once; run_videocr matches them against every line the
+# worker process emits.
+UNSUPPORTED_HARDWARE_ERROR_PATTERN = re.compile(r"Unsupported Hardware Error: (.*)")
+WARNING_HARDWARE_PATTERN = re.compile(r"Hardware Check Warning: (.*)")
+PROCESS_ERROR_PATTERN = re.compile(r"Error: Process failed.")
+STEP1_PROGRESS_PATTERN = re.compile(r"Step (\d+)/\d+: Processing video\.\.\. Current: ([\d:]+) / ([\d:]+|Unknown), Frame: (\d+)")
+STEP_IMAGE_PROGRESS_PATTERN = re.compile(r"Step (\d+)/\d+: Performing (?:Text-Detection|OCR) on image (\d+) of (\d+)")
+REPACKING_PATTERN = re.compile(r"Analyzing frame (\d+) of (\d+)")
+STARTING_PADDLEOCR_PATTERN = re.compile(r"Starting PaddleOCR\.\.\.")
+STARTING_LENS_PATTERN = re.compile(r"Starting Google Lens CLI\.\.\.")
+INFO_PASS_PATTERN = re.compile(r"Running Text-Detection-Only pass on (\d+) filtered frame\(s\) stitched into (\d+) image grid\(s\)\.\.\.")
+FILTERED_PATTERN = re.compile(r"Filtered out (\d+) redundant frame\(s\) via Text-Detection and tight-box SSIM analysis\.")
+GENERATING_SUBTITLES_PATTERN = re.compile(r"Generating subtitles\.\.\.")
+REACHED_END_TIME_PATTERN = re.compile(r"Reached end time\. Stopping\.")
+
+# First words of every line the patterns above can match; anything else skips the
+# decode and regex cascade entirely. Bytes because the pipe is read undecoded.
+_CLI_LINE_PREFIXES = (
+    b"Step", b"Starting", b"Generating", b"Analyzing", b"Running",
+    b"Filtered", b"Reached", b"Error:", b"Unsupported", b"Hardware",
+)
+
+
+def _iter_cli_lines(pipe: IO[bytes]) -> Iterator[bytes]:
+    """Yields the pipe's output split on both '\\r' and '\\n'.
+
+    The CLI emits per-frame progress as '\\r'-terminated chunks, so a binary
+    readline() would sit on a whole step's worth of ticks until the closing
+    newline. os.read returns whatever the pipe currently holds; a chunk that
+    ends mid-line is carried into the next read, and empty segments from
+    '\\r\\n' pairs are dropped.
+    """
+    fd = pipe.fileno()
+    tail = b''
+    while chunk := os.read(fd, 65536):
+        segments = re.split(b'[\r\n]', tail + chunk)
+        tail = segments.pop()
+        for segment in segments:
+            if segment:
+                yield segment
+    if tail:
+        yield tail
+
+
 def run_videocr(args_dict: dict[str, Any], window: sg.Window) -> bool:
     """Runs the videocr-cli tool in a separate process and streams output."""
     if not VIDEOCR_PATH:
@@ -1769,19 +2165,6 @@ def run_videocr(args_dict: dict[str, Any], window: sg.Window) -> bool:
                 else:
                     command.append(str(value))
 
-    UNSUPPORTED_HARDWARE_ERROR_PATTERN = re.compile(r"Unsupported Hardware Error: (.*)")
-    WARNING_HARDWARE_PATTERN = re.compile(r"Hardware Check Warning: (.*)")
-    PROCESS_ERROR_PATTERN = re.compile(r"Error: Process failed.")
-    STEP1_PROGRESS_PATTERN = re.compile(r"Step (\d+)/\d+: Processing video\.\.\. Current: ([\d:]+) / ([\d:]+|Unknown), Frame: (\d+)")
-    STEP_IMAGE_PROGRESS_PATTERN = re.compile(r"Step (\d+)/\d+: Performing (?:Text-Detection|OCR) on image (\d+) of (\d+)")
-    REPACKING_PATTERN = re.compile(r"Analyzing frame (\d+) of (\d+)")
-    STARTING_PADDLEOCR_PATTERN = re.compile(r"Starting PaddleOCR\.\.\.")
-    STARTING_LENS_PATTERN = re.compile(r"Starting Google Lens CLI\.\.\.")
-    INFO_PASS_PATTERN = re.compile(r"Running Text-Detection-Only pass on (\d+) filtered frame\(s\) stitched into (\d+) image grid\(s\)\.\.\.")
-    FILTERED_PATTERN = re.compile(r"Filtered out (\d+) redundant frame\(s\) via Text-Detection and tight-box SSIM analysis\.")
-    GENERATING_SUBTITLES_PATTERN = re.compile(r"Generating subtitles\.\.\.")
-    REACHED_END_TIME_PATTERN = re.compile(r"Reached end time\. Stopping\.")
-
     last_reported_percentage_step1 = -1.0
     last_reported_percentage_step2 = -1.0
     last_reported_percentage_step3 = -1.0
@@ -1799,16 +2182,14 @@ def run_videocr(args_dict: dict[str, Any], window: sg.Window) -> bool:
         creationflags = subprocess.CREATE_NO_WINDOW
 
     try:
-        stdout_lines: list[str] = []
-        stderr_lines: list[str] = []
+        stdout_lines: list[bytes] = []
+        stderr_lines: list[bytes] = []
 
+        # Pipes stay binary: the io layer then skips per-byte decoding and line
+        # buffering, and only lines that can match a pattern are decoded below.
         process = subprocess.Popen(command,
                                    stdout=subprocess.PIPE,
                                    stderr=subprocess.PIPE,
-                                   text=True,
-                                   encoding='utf-8',
-                                   errors='replace',
-                                   bufsize=1,
                                    creationflags=creationflags,
                                    start_new_session=(sys.platform != "win32")
                                    )
@@ -1819,14 +2200,11 @@ def run_videocr(args_dict: dict[str, Any], window: sg.Window) -> bool:
         stderr_thread.start()
 
         if process.stdout:
-            for line in iter(process.stdout.readline, ''):
-                stdout_lines.append(line)
-
-                if process.poll() is not None and line == '':
-                    break
-                line = line.rstrip('\r\n')
+            for raw_line in _iter_cli_lines(process.stdout):
+                stdout_lines.append(raw_line)
 
                 if expecting_log_path:
+                    line = raw_line.decode('utf-8', errors='replace').rstrip('\r\n')
                     log_path = line.strip()
                     full_error_output = f"\n{process_error_message}\n{log_path}\n"
                     gui_queue.put(('-VIDEOCR_OUTPUT-', full_error_output))
@@ -1834,6 +2212,13 @@ def run_videocr(args_dict: dict[str, Any], window: sg.Window) -> bool:
                     process_error_message = ""
                     continue
 
+                # Most CLI output is uninteresting; bail before decoding and the
+                # regex cascade unless the line can possibly match a pattern.
+                if not raw_line.lstrip(b' ').startswith(_CLI_LINE_PREFIXES):
+                    continue
+
+                line = raw_line.decode('utf-8', errors='replace').rstrip('\r\n')
+
                 if PROCESS_ERROR_PATTERN.search(line):
                     process_error_message = line.strip()
                     expecting_log_path = True
@@ -1930,10 +2315,11 @@ def run_videocr(args_dict: dict[str, Any], window: sg.Window) -> bool:
         exit_code = process.wait()
         stderr_thread.join()
 
-        process_was_cancelled = getattr(window, 'cancelled_by_user', False)
+        process_was_cancelled = window.cancelled_by_user
         if exit_code != 0 and not process_was_cancelled:
-            full_stdout = "".join(stdout_lines)
-            full_stderr = "".join(stderr_lines)
+            # stdout lines arrive without their separators, stderr lines keep theirs.
+            full_stdout = b"\n".join(stdout_lines).decode('utf-8', errors='replace')
+            full_stderr = b"".join(stderr_lines).decode('utf-8', errors='replace')
 
             if ("Error: Process failed" not in full_stdout and "Unsupported Hardware Error:" not in full_stdout):
                 log_message = (
@@ -1986,10 +2372,15 @@ def run_batch_thread(window: sg.Window, queue_data: list[dict[str, Any]]) -> Non
     last_processed_args = None
 
     while True:
-        if getattr(window, 'cancelled_by_user', False):
+        if window.cancelled_by_user:
             break
 
-        current_job = next((j for j in queue_data if j['status'] == 'Pending'), None)
+        current_job = None
+        for idx, job in enumerate(queue_data):
+            if job['status'] == 'Pending':
+                current_job = job
+                window.active_job_idx = idx
+                break
 
         if not current_job:
             break
@@ -2006,7 +2397,7 @@ def run_batch_thread(window: sg.Window, queue_data: list[dict[str, Any]]) -> Non
 
         success = run_videocr(args, window)
 
-        if getattr(window, 'cancelled_by_user', False):
+        if window.cancelled_by_user:
             current_job['status'] = 'Cancelled'
         else:
             if success:
@@ -2021,7 +2412,9 @@ def run_batch_thread(window: sg.Window, queue_data: list[dict[str, Any]]) -> Non
         gui_queue.put(('-BATCH-REFRESH-', None))
         time.sleep(0.1)
 
-    if not getattr(window, 'cancelled_by_user', False) and last_processed_args and success_count > 0:
+    window.active_job_idx = None
+
+    if not window.cancelled_by_user and last_processed_args and success_count > 0:
         if last_processed_args.get('send_notification', True):
             notification_title = LANG.get('notification_title', "Your Subtitle generation is done!")
             if success_count == 1:
@@ -2033,6 +2426,23 @@ def run_batch_thread(window: sg.Window, queue_data: list[dict[str, Any]]) -> Non
     gui_queue.put(('-BATCH-FINISHED-', None))
 
 
+def set_active_job_status(window: sg.Window, new_status: str, expected_status: str) -> None:
+    """Flips the active job's status via its tracked index.
+
+    Falls back to a scan when the index is stale, e.g. after the user
+    reordered the queue while a job was running.
+    """
+    idx = getattr(window, 'active_job_idx', None)
+    if idx is not None and 0 <= idx < len(batch_queue) and batch_queue[idx]['status'] == expected_status:
+        batch_queue[idx]['status'] = new_status
+        return
+
+    for job in batch_queue:
+        if job['status'] == expected_status:
+            job['status'] = new_status
+            break
+
+
 def update_queue_tab_count(window: sg.Window, queue: list[dict[str, Any]]) -> None:
     """Updates the Queue tab title. Counts Pending, Processing, Cancelled, Paused."""
     active_count = len([j for j in queue if j['status'] in ('Pending', 'Processing', 'Cancelled', 'Paused')])
@@ -2049,24 +2459,85 @@ def update_queue_tab_count(window: sg.Window, queue: list[dict[str, Any]]) -> No
         log_error(f"Failed to update tab title: {e}")
 
 
+# Output path -> queue index, rebuilt on every table refresh so the duplicate
+# checks in the add/run handlers are a single dict lookup instead of a scan.
+queue_index_by_output: dict[str, int] = {}
+
+
 def refresh_batch_table(window: sg.Window) -> None:
-    """Refreshes the batch table with translated status text."""
+    """Refreshes the batch table with translated status text.
+
+    While the row count is unchanged (the common case: status flips during a
+    running batch) only the rows that differ from the last refresh are pushed
+    into the Treeview instead of rebuilding the whole table.
+    """
     data: list[list[str]] = []
-    for item in batch_queue:
+    queue_index_by_output.clear()
+    for idx, item in enumerate(batch_queue):
+        queue_index_by_output[item['args']['output']] = idx
         display_status = get_translated_status(item['status'])
         data.append([item['filename'], item['output'], display_status])
 
-    window['-BATCH-TABLE-'].update(values=data)
+    table_element = window['-BATCH-TABLE-']
+    last_rows = getattr(window, 'last_table_rows', None)
+
+    if last_rows is None or len(last_rows) != len(data):
+        table_element.update(values=data)
+    else:
+        tree_widget = table_element.Widget
+        row_ids = tree_widget.get_children()
+        for idx, row in enumerate(data):
+            if row != last_rows[idx]:
+                tree_widget.item(row_ids[idx], values=row)
+        table_element.Values = data
+
+    window.last_table_rows = data
     update_queue_tab_count(window, batch_queue)
 
 
+def _flush_table_refresh(window: sg.Window) -> None:
+    """Timer callback that performs a pending batch table refresh."""
+    window.table_refresh_scheduled = False
+    if getattr(window, 'table_dirty', False):
+        window.table_dirty = False
+        refresh_batch_table(window)
+
+
+def mark_table_dirty(window: sg.Window) -> None:
+    """Requests a batch table refresh, coalescing bursts into a single redraw.
+
+    Used for worker-driven status updates; user-driven actions keep calling
+    refresh_batch_table directly so their feedback stays instant.
+    """
+    window.table_dirty = True
+    if not getattr(window, 'table_refresh_scheduled', False):
+        window.table_refresh_scheduled = True
+        window.TKroot.after(20, lambda: _flush_table_refresh(window))
+
+
+# Handle for the current worker process, so pause/resume toggles reuse it instead of
+# re-resolving the PID each click. psutil.suspend/resume already maps to
+# SIGSTOP/SIGCONT on POSIX and the native suspend calls on Windows.
+_pause_proc_cache: dict[int, psutil.Process] = {}
+
+
+def _get_pause_process(pid: int) -> psutil.Process:
+    """Returns a cached psutil handle for the PID, rebuilding it if the process changed."""
+    proc = _pause_proc_cache.get(pid)
+    if proc is None or not proc.is_running():
+        proc = psutil.Process(pid)
+        _pause_proc_cache.clear()
+        _pause_proc_cache[pid] = proc
+    return proc
+
+
 def set_process_pause_state(pid: int, pause: bool = True) -> bool:
     """
     Pauses (suspends) or Resumes the process with the given PID
     and its entire child process tree.
     """
     try:
-        parent = psutil.Process(pid)
+        parent = _get_pause_process(pid)
 
         if pause:
             parent.suspend()
@@ -2114,7 +2585,7 @@ def set_system_awake(should_be_awake: bool) -> None:
 
 def execute_post_completion_action(window: sg.Window, icon: str | bytes | None = None) -> None:
     """Executes the selected system action based on the Combo box index."""
-    if getattr(window, 'cancelled_by_user', False):
+    if window.cancelled_by_user:
         return
 
     selected_index = window['-POST_ACTION-'].Widget.current()
@@ -2180,7 +2651,7 @@ def update_taskbar(state: str | None = None, progress: int | None = None) -> Non
 
 def check_crop_validity(video_path: str, args: dict[str, Any]) -> tuple[bool, str | None]:
     """Checks if the crop coordinates in 'args' fit within the video dimensions."""
-    width, height, _ = video_manager.open(video_path).values()
+    width, height, _ = probe_video(video_path).values()
     if width == 0 or height == 0:
         return False, "Could not determine video dimensions."
 
@@ -2552,6 +3023,15 @@ else:
         window.refresh()
 
 # --- Load settings when the application starts ---
+# Hot-path flags initialized up front so handlers and the event loop use
+# direct attribute reads instead of getattr/hasattr probes.
+window.is_drawing = False
+window.needs_mouse_up = False
+window.is_processing = False
+window.cancelled_by_user = False
+window.decode_pending = False
+window.last_drag_point = None
+
 load_settings(window)
 
 update_gui_text(window)
@@ -2563,7 +3043,84 @@ if sys.platform == 'win32':
 
 video_manager = VideoHandler()
 
+# --- Asynchronous preview decode ---
+# Slider scrubbing posts seek requests here; the decode thread keeps only the
+# newest one (stale requests are dropped), decodes off the GUI thread and hands
+# the frame back through gui_queue so rapid drags never block the event loop.
+frame_request_queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=1)
+
+
+def request_preview_frame(path: str, timestamp_ms: float, display_size: tuple[int, int], brightness_threshold: int | None) -> None:
+    """Queues a seek for the decode thread, replacing any not-yet-started request."""
+    window.decode_pending = True
+    request = {'path': path, 'timestamp_ms': timestamp_ms, 'display_size': display_size, 'brightness_threshold': brightness_threshold}
+    while True:
+        try:
+            frame_request_queue.put_nowait(request)
+            return
+        except queue.Full:
+            with contextlib.suppress(queue.Empty):
+                frame_request_queue.get_nowait()
+
+
+def preview_decode_worker() -> None:
+    while True:
+        request = frame_request_queue.get()
+        img_bytes, res_w, res_h, off_x, off_y = video_manager.get_frame(
+            request['timestamp_ms'], request['display_size'],
+            brightness_threshold=request['brightness_threshold'])
+
+        # A request that arrived during the decode supersedes this frame; the
+        # GUI would drop it anyway, so skip the queue round trip and redraw.
+        # The newer request's own result will clear the pending flag.
+        if not frame_request_queue.empty():
+            continue
+
+        # A failed decode still posts (frame=None) so the GUI side can clear
+        # its in-flight marker instead of fast-polling forever.
+        gui_queue.put(('-FRAME-READY-', {
+            'path': request['path'],
+            'timestamp_ms': request['timestamp_ms'],
+            'frame': (img_bytes.getvalue(), res_w, res_h, off_x, off_y) if img_bytes else None,
+        }))
+
+
+threading.Thread(target=preview_decode_worker, daemon=True).start()
+
 graph = window["-GRAPH-"]
+# The graph element is part of the static layout, so this never changes after window creation.
+HAS_GRAPH = '-GRAPH-' in window.AllKeysDict
+
+# Pause buttons validated once so the pause/resume handlers skip per-event membership checks.
+PAUSE_BUTTON_KEYS = tuple(k for k in ('-BTN-PAUSE-', '-BTN-BATCH-PAUSE-') if k in window.AllKeysDict)
+
+output_log = OutputLog(window)
+
+# PID of the running worker process; initialized so the event loop can read the
+# attribute directly instead of going through getattr/hasattr fallbacks.
+window._videocr_process_pid = None
+
+# Argument-name -> settings-widget map, resolved once so restoring a job skips the
+# per-argument key formatting and window lookups.
+ARG_WIDGETS = {key[2:]: window[key] for key in window.AllKeysDict if isinstance(key, str) and key.startswith('--')}
+
+# Full-key -> CLI-argument-name map for the Run handler, derived once from the
+# layout; saves re-filtering the values dict and stripping keys per click.
+CLI_ARG_KEY_MAP = {f'--{name}': name for name in ARG_WIDGETS if f'--{name}' not in CLI_EXCLUDED_ARG_KEYS}
+
+# Hot-path element handles, resolved once; these widgets are updated
+# continuously during scrubbing and worker progress output.
+TIME_TEXT_ELEM = window['-TIME_TEXT-']
+STATUS_LINE_ELEM = window['-STATUS-LINE-']
+ETA_LINE_ELEM = window['-ETA-LINE-']
+PROGRESS_BAR_ELEM = window['-PROGRESS-BAR-']
+
+
+# Cached Tk image of the current frame. Rebuilt only when the frame bytes
+# change; redraws in between reuse the same canvas item.
+window.base_photo = None
+window.base_photo_bytes = None
+window.base_image_id = None
 
 
 # --- Initialize crop box state in the window object ---
@@ -2578,6 +3135,7 @@ def reset_crop_state() -> None:
     window.crop_boxes = []
     window.resize_state = None
     window.hover_state = None
+    window.last_edit_key = None
     crop_not_set_text = LANG.get('crop_not_set', "Not Set")
     window['-CROP_COORDS-'].update(crop_not_set_text)
     window["-BTN-CLEAR_CROP-"].update(disabled=True)
@@ -2586,53 +3144,71 @@ def reset_crop_state() -> None:
 reset_crop_state()
 
 
-def redraw_canvas_and_boxes() -> None:
-    """Erases the graph, redraws the current frame, finalized crop boxes, and the active drawing box."""
-    global graph, current_image_bytes, image_offset_x, image_offset_y, resized_frame_width, resized_frame_height
-
+def clear_graph() -> None:
+    """Erases the graph and drops the cached base-image canvas item."""
     graph.erase()
-    if current_image_bytes:
-        graph.draw_image(data=current_image_bytes, location=(image_offset_x, image_offset_y))
-
+    window.base_photo = None
+    window.base_photo_bytes = None
+    window.base_image_id = None
     window.drawn_rect_ids.clear()
 
-    boxes_to_draw = [box['img_points'] for box in window.crop_boxes]
 
-    if window.start_point_img is not None and window.end_point_img is not None:
-        boxes_to_draw.append((window.start_point_img, window.end_point_img))
+def sync_base_image() -> None:
+    """Keeps one canvas image item in sync with current_image_bytes.
 
-    for start_img, end_img in boxes_to_draw:
-        rect_x1_img = min(start_img[0], end_img[0])
-        rect_y1_img = min(start_img[1], end_img[1])
-        rect_x2_img = max(start_img[0], end_img[0])
-        rect_y2_img = max(start_img[1], end_img[1])
+    The bytes are parsed into a Tk PhotoImage only when they actually change;
+    redraws with an unchanged frame just reposition the existing canvas item,
+    so drag-motion redraws skip the per-call image decode and upload.
+    """
+    global graph, current_image_bytes, image_offset_x, image_offset_y
+
+    canvas = graph.Widget
+    if not current_image_bytes:
+        if window.base_image_id is not None:
+            canvas.delete(window.base_image_id)
+        window.base_photo = None
+        window.base_photo_bytes = None
+        window.base_image_id = None
+        return
 
-        draw_x1 = max(0, rect_x1_img)
-        draw_y1 = max(0, rect_y1_img)
-        draw_x2 = min(resized_frame_width - 1, rect_x2_img)
-        draw_y2 = min(resized_frame_height - 1, rect_y2_img)
+    if current_image_bytes != window.base_photo_bytes:
+        window.base_photo = sg.tk.PhotoImage(data=current_image_bytes)
+        window.base_photo_bytes = current_image_bytes
 
-        start_graph = (draw_x1 + image_offset_x, draw_y1 + image_offset_y)
-        end_graph = (draw_x2 + image_offset_x, draw_y2 + image_offset_y)
+    canvas_loc = graph._convert_xy_to_canvas_xy(image_offset_x, image_offset_y)
+    if window.base_image_id is None:
+        window.base_image_id = canvas.create_image(canvas_loc, image=window.base_photo, anchor='nw')
+        canvas.tag_lower(window.base_image_id)
+    else:
+        canvas.itemconfig(window.base_image_id, image=window.base_photo)
+        canvas.coords(window.base_image_id, *canvas_loc)
 
-        rect_id = graph.draw_rectangle(start_graph, end_graph, line_color='red')
-        window.drawn_rect_ids.append(rect_id)
+
+def redraw_canvas_and_boxes() -> None:
+    """Syncs the current frame image, finalized crop boxes, and the active drawing box."""
+    sync_base_image()
+    redraw_boxes()
 
 
 def redraw_boxes() -> None:
-    """Deletes the rectangles and redraws them without erasing the graph."""
+    """Syncs the red crop rectangles without touching the frame image."""
     global graph, image_offset_x, image_offset_y, resized_frame_width, resized_frame_height
 
-    for rect_id in window.drawn_rect_ids:
-        graph.delete_figure(rect_id)
-    window.drawn_rect_ids.clear()
-
     boxes_to_draw = [box['img_points'] for box in window.crop_boxes]
 
     if window.start_point_img is not None and window.end_point_img is not None:
         boxes_to_draw.append((window.start_point_img, window.end_point_img))
 
-    for start_img, end_img in boxes_to_draw:
+    # During a drag the box count is constant, so the existing rectangle items
+    # are just moved with coords(); create/delete only happens when it changes.
+    reuse_items = len(window.drawn_rect_ids) == len(boxes_to_draw)
+    if not reuse_items:
+        for rect_id in window.drawn_rect_ids:
+            graph.delete_figure(rect_id)
+        window.drawn_rect_ids.clear()
+
+    canvas = graph.Widget
+    for i, (start_img, end_img) in enumerate(boxes_to_draw):
         rect_x1_img = min(start_img[0], end_img[0])
         rect_y1_img = min(start_img[1], end_img[1])
         rect_x2_img = max(start_img[0], end_img[0])
@@ -2646,8 +3222,13 @@ def redraw_boxes() -> None:
         start_graph = (draw_x1 + image_offset_x, draw_y1 + image_offset_y)
         end_graph = (draw_x2 + image_offset_x, draw_y2 + image_offset_y)
 
-        rect_id = graph.draw_rectangle(start_graph, end_graph, line_color='red')
-        window.drawn_rect_ids.append(rect_id)
+        if reuse_items:
+            canvas.coords(window.drawn_rect_ids[i],
+                          *graph._convert_xy_to_canvas_xy(*start_graph),
+                          *graph._convert_xy_to_canvas_xy(*end_graph))
+        else:
+            rect_id = graph.draw_rectangle(start_graph, end_graph, line_color='red')
+            window.drawn_rect_ids.append(rect_id)
 
 
 def get_resize_hit(x: int | float, y: int | float, boxes: list[dict[str, Any]], tolerance: int = 8) -> tuple[int | None, str | None, str]:
@@ -2709,45 +3290,23 @@ window['-BATCH-TABLE-'].bind('<Shift-KeyPress-Up>', '-SHIFT-UP')
 # --- Failsafe for PySimpleGUI's overwrite event bug (-Graph-+UP with -GRAPH-+MOVE) on fast movements---
 def force_mouse_up(event: Any) -> None:
     """Sets a silent flag so the main loop can manually override the +MOVE event back to +UP."""
-    if getattr(window, 'is_drawing', False):
+    if window.is_drawing:
         window.needs_mouse_up = True
 
 
 window['-GRAPH-'].Widget.bind('<ButtonRelease-1>', force_mouse_up, add='+')
 
-# --- Cursor Change Logic for -GITHUB_ISSUES_LINK- ---
-issues_link_element = window['-GITHUB_ISSUES_LINK-']
-
-
-def on_issues_enter(event: Any) -> None:
-    """Callback when mouse enters the Issues link text."""
-    issues_link_element.Widget.config(cursor="hand2")
-
 
-def on_issues_leave(event: Any) -> None:
-    """Callback when mouse leaves the Issues link text."""
-    issues_link_element.Widget.config(cursor="")
+# --- Cursor Change Logic for the GitHub link labels ---
+def add_hover_cursor(element: sg.Element) -> None:
+    """Shows the hand cursor while the mouse is over a link label."""
+    widget = element.Widget
+    widget.bind("<Enter>", lambda e: widget.config(cursor="hand2"))
+    widget.bind("<Leave>", lambda e: widget.config(cursor=""))
 
 
-issues_link_element.Widget.bind("<Enter>", on_issues_enter)
-issues_link_element.Widget.bind("<Leave>", on_issues_leave)
-
-# --- Cursor Change Logic for -GITHUB_RELEASES_LINK- ---
-releases_link_element = window['-GITHUB_RELEASES_LINK-']
-
-
-def on_releases_enter(event: Any) -> None:
-    """Callback when mouse enters the Releases link text."""
-    releases_link_element.Widget.config(cursor="hand2")
-
-
-def on_releases_leave(event: Any) -> None:
-    """Callback when mouse leaves the Releases link text."""
-    releases_link_element.Widget.config(cursor="")
-
-
-releases_link_element.Widget.bind("<Enter>", on_releases_enter)
-releases_link_element.Widget.bind("<Leave>", on_releases_leave)
+add_hover_cursor(window['-GITHUB_ISSUES_LINK-'])
+add_hover_cursor(window['-GITHUB_RELEASES_LINK-'])
 
 check_for_updates_checked_at_start = window.find_element('--check_for_updates').get()
 if check_for_updates_checked_at_start:
@@ -2759,7 +3318,7 @@ if not save_in_video_dir_checked_at_start:
 
 
 # --- Define the list of keys that, when changed, should trigger a settings save ---
-KEYS_TO_AUTOSAVE = [
+KEYS_TO_AUTOSAVE = (
     '-UI_LANG_COMBO-',
     '-OCR_ENGINE_COMBO-',
     '-LANG_COMBO-',
@@ -2793,108 +3352,357 @@ KEYS_TO_AUTOSAVE = [
     '--normalize_to_simplified_chinese',
     '-POST_ACTION-',
     'gui_scaling',
-]
+)
+
+# Frozen-set twin for the per-event membership test; the tuple above keeps the
+# stable iteration order used to build the autosave signature.
+AUTOSAVE_KEY_SET = frozenset(KEYS_TO_AUTOSAVE)
+
+# Debounced autosave state: values waiting to be written and their deadline.
+window.pending_save_values = None
+window.pending_save_deadline = None
+
+# Signature of the last autosaved values; lets the loop skip config writes when an
+# autosave-keyed event fires without any actual value change (e.g. focus events).
+last_settings_sig: tuple[Any, ...] | None = None
+
+
+# --- Worker queue message handlers ---
+# Messages from the worker thread arrive in bursts during processing, so they are
+# dispatched through a dict instead of walking an if/elif chain per message.
+def _on_process_started(window: sg.Window, msg_data: Any) -> None:
+    window._videocr_process_pid = msg_data
+    window['-BTN-RUN-'].update(disabled=True)
+    window['-BTN-CANCEL-'].update(disabled=False)
+    window['-BTN-BATCH-STOP-'].update(disabled=False)
+
+
+def _on_progress_smooth(window: sg.Window, msg_data: Any) -> None:
+    if msg_data.get('text'):
+        STATUS_LINE_ELEM.update(msg_data['text'])
+    if msg_data.get('eta'):
+        ETA_LINE_ELEM.update(msg_data['eta'])
+    if msg_data.get('percent') is not None:
+        PROGRESS_BAR_ELEM.update(msg_data['percent'])
+
+
+def _on_videocr_output(window: sg.Window, msg_data: Any) -> None:
+    if msg_data.strip():
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        final_text = f"[{timestamp}] {msg_data}"
+    else:
+        final_text = msg_data
+    output_log.write(final_text)
+
+
+def _on_taskbar_state_update(window: sg.Window, msg_data: Any) -> None:
+    update_taskbar(state=msg_data.get('state'), progress=msg_data.get('progress'))
+
+
+def _on_notification_event(window: sg.Window, msg_data: Any) -> None:
+    send_notification(msg_data['title'], msg_data['message'])
+
+
+def _on_batch_refresh(window: sg.Window, msg_data: Any) -> None:
+    mark_table_dirty(window)
+
+
+def _on_frame_ready(window: sg.Window, msg_data: Any) -> None:
+    global resized_frame_width, resized_frame_height, image_offset_x, image_offset_y, current_image_bytes
+
+    window.decode_pending = False
+
+    if msg_data['frame'] is None:
+        return
+
+    # Drop frames that no longer match the loaded video or the latest seek target.
+    if msg_data['path'] != video_path or msg_data['timestamp_ms'] != current_time_ms:
+        return
+
+    frame_bytes, res_w, res_h, off_x, off_y = msg_data['frame']
+    resized_frame_width, resized_frame_height = res_w, res_h
+    image_offset_x, image_offset_y = off_x, off_y
+    current_image_bytes = frame_bytes
+    redraw_canvas_and_boxes()
+
+
+def _on_batch_finished(window: sg.Window, msg_data: Any) -> None:
+    window.is_processing = False
+    set_system_awake(False)
+
+    with batched_updates(window) as update_elem:
+        for btn in ['-BTN-BATCH-START-', '-BTN-RUN-']:
+            update_elem(btn, disabled=False)
+
+        update_elem('-BTN-BATCH-PAUSE-', disabled=True, text=_L.btn_pause)
+        update_elem('-BTN-PAUSE-', disabled=True, text=_L.btn_pause)
+        update_elem('-BTN-CANCEL-', disabled=True)
+        update_elem('-BTN-BATCH-STOP-', disabled=True)
+        update_elem('-SAVE_AS_BTN-', disabled=not video_path)
+        update_elem('--output', disabled=not video_path)
+        update_elem('-PROGRESS-BAR-', current_count=0)
+        update_elem('-STATUS-LINE-', value="")
+        update_elem('-ETA-LINE-', value="")
+    msg = LANG.get('status_queue_cancelled', "Queue Cancelled") if window.cancelled_by_user else LANG.get('status_queue_finished', "Queue Finished")
+    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+    output_log.write('\n')
+    output_log.write(f"[{timestamp}] {msg}\n")
+
+    window._videocr_process_pid = None
+
+    update_taskbar(state='normal', progress=0)
+    update_run_and_cancel_button_state(window, batch_queue)
+    execute_post_completion_action(window, icon=ICON_PATH)
+
+    window.cancelled_by_user = False
+
+
+GUI_QUEUE_HANDLERS = {
+    '-PROCESS_STARTED-': _on_process_started,
+    '-PROGRESS-SMOOTH-': _on_progress_smooth,
+    '-VIDEOCR_OUTPUT-': _on_videocr_output,
+    '-TASKBAR_STATE_UPDATE-': _on_taskbar_state_update,
+    '-NOTIFICATION_EVENT-': _on_notification_event,
+    '-BATCH-REFRESH-': _on_batch_refresh,
+    '-FRAME-READY-': _on_frame_ready,
+    '-BATCH-FINISHED-': _on_batch_finished,
+}
+
+
+# --- Self-contained event handlers, dispatched by table lookup ---
+# Branches that neither read nor write the loop's video/crop state live here;
+# the stateful ones stay in the elif chain below.
+def _on_open_file(window: sg.Window, values: dict[str, Any]) -> None:
+    filename = sg.tk.filedialog.askopenfilename(
+        filetypes=_dialog_filetypes['video_open'],
+        parent=window.TKroot
+    )
+    if filename:
+        window['-VIDEO-LIST-'].update(value=filename, values=[filename], size=(38, None), disabled=False)
+        window.write_event_value('-VIDEO-LIST-', filename)
+
+
+def _on_open_folder(window: sg.Window, values: dict[str, Any]) -> None:
+    folder = sg.tk.filedialog.askdirectory(parent=window.TKroot)
+    if folder:
+        videos = scan_video_folder(folder)
+        if videos:
+            window['-VIDEO-LIST-'].update(value=videos[0], values=videos, size=(38, None), disabled=False)
+            window.write_event_value('-VIDEO-LIST-', videos[0])
+        else:
+            custom_popup(window, "No Videos", "No supported videos found in folder.", icon=ICON_PATH)
+
+
+def _on_folder_browse(window: sg.Window, values: dict[str, Any]) -> None:
+    folder = sg.tk.filedialog.askdirectory()
+    if folder:
+        window['--default_output_dir'].update(folder)
+
+
+def _on_ocr_info(window: sg.Window, values: dict[str, Any]) -> None:
+    custom_popup(window, LANG.get('engine_info', "OCR Engine Information"), LANG.get('engine_message', (
+        "PaddleOCR (Det. + Rec.):\n"
+        "• 100% local processing.\n"
+        "• Both text detection and recognition are done locally.\n\n"
+        "PaddleOCR (Det.) + Google Lens (Rec.):\n"
+        "• Hybrid processing.\n"
+        "• PaddleOCR handles text detection locally.\n"
+        "• Google Lens (online) handles text recognition.\n"
+        "• Requires an active internet connection.")),
+        icon=ICON_PATH
+    )
+
+
+def _on_new_version_found(window: sg.Window, values: dict[str, Any]) -> None:
+    update_popup(
+        parent_window=window,
+        version_info=values['-NEW_VERSION_FOUND-'],
+        current_version=PROGRAM_VERSION,
+        icon=ICON_PATH
+    )
+
+
+def _on_check_update_manual(window: sg.Window, values: dict[str, Any]) -> None:
+    threading.Thread(target=check_for_updates, args=(window, True), daemon=True).start()
+
+
+def _on_no_update_found(window: sg.Window, values: dict[str, Any]) -> None:
+    custom_popup(window, LANG.get('update_title_uptodate', "Up to Date"), LANG.get('update_msg_uptodate', "You are running the latest version of VideOCR."), icon=ICON_PATH)
+
+
+def _on_update_check_failed(window: sg.Window, values: dict[str, Any]) -> None:
+    custom_popup(window, LANG.get('update_title_error', "Error"), LANG.get('update_msg_error', "Failed to check for updates.\nPlease check your internet connection."), icon=ICON_PATH)
+
+
+def _on_tab_changed(window: sg.Window, values: dict[str, Any]) -> None:
+    if values.get('-TABGROUP-') == '-TAB-VIDEO-' and HAS_GRAPH:
+        graph.set_focus()
+
+
+def _on_help(window: sg.Window, values: dict[str, Any]) -> None:
+    custom_popup(window, LANG.get('help_title', "Cropping Info"), LANG.get('help_message', (
+        "Draw a crop box over the subtitle region in the video.\n"
+        "Use click+drag to select.\n"
+        "In 'Dual Zone' mode, you can draw two crop boxes.\n"
+        "If no crop box is selected, the bottom third of the video\n"
+        "will be used for OCR by default.")),
+        icon=ICON_PATH
+    )
+
+
+def _on_github_issues(window: sg.Window, values: dict[str, Any]) -> None:
+    webbrowser.open("https://github.com/timminator/VideOCR/issues")
+
+
+def _on_github_releases(window: sg.Window, values: dict[str, Any]) -> None:
+    webbrowser.open("https://github.com/timminator/VideOCR/releases")
+
+
+def _on_save_as(window: sg.Window, values: dict[str, Any]) -> None:
+    output_file_path = pathlib.Path(values["--output"])
+    initial_dir = str(output_file_path.parent)
+    initial_file = output_file_path.stem
+
+    save_as_title = LANG.get('save_as_title', "Save As")
+
+    # Usage of tkinter.tkFileDialog instead of sg.popup_get_file because of the window placement on screen
+    filename_chosen = sg.tk.filedialog.asksaveasfilename(
+        defaultextension='srt',
+        filetypes=_dialog_filetypes['save_as'],
+        initialdir=initial_dir,
+        initialfile=initial_file,
+        parent=window.TKroot,
+        title=save_as_title
+    )
+
+    if filename_chosen != "":
+        window["--output"].update(filename_chosen)
+
+
+def _on_window_restored(window: sg.Window, values: dict[str, Any]) -> None:
+    if HAS_GRAPH:
+        graph.set_focus()
+
+
+EVENT_DISPATCH = {
+    '-BTN-OPEN-FILE-': _on_open_file,
+    '-BTN-OPEN-FOLDER-': _on_open_folder,
+    '-BTN-FOLDER_BROWSE-': _on_folder_browse,
+    '-BTN-OCR-INFO-': _on_ocr_info,
+    '-NEW_VERSION_FOUND-': _on_new_version_found,
+    '-BTN-CHECK_UPDATE_MANUAL-': _on_check_update_manual,
+    '-NO_UPDATE_FOUND-': _on_no_update_found,
+    '-UPDATE_CHECK_FAILED-': _on_update_check_failed,
+    '-TABGROUP-': _on_tab_changed,
+    '-BTN-HELP-': _on_help,
+    '-GITHUB_ISSUES_LINK-': _on_github_issues,
+    '-GITHUB_RELEASES_LINK-': _on_github_releases,
+    '-SAVE_AS_BTN-': _on_save_as,
+    '-WINDOW_RESTORED-': _on_window_restored,
+}
+
+
+# Events where only the newest occurrence matters; intermediate ones carry
+# stale coordinates and only cost redundant redraws.
+COALESCED_EVENTS = frozenset({'-GRAPH-', '-GRAPH-+MOVE', '-SLIDER-', '-GRAPH-<Left>', '-GRAPH-<Right>'})
+
+# Event stashed by read_event_coalesced when a drain run hits a different event.
+_pending_event: tuple[Any, dict[str, Any]] | None = None
+
+
+def read_event_coalesced(window: sg.Window, timeout: int = 50) -> tuple[Any, dict[str, Any]]:
+    """Reads one event, collapsing bursts of the same coalescable event.
+
+    During a crop drag or slider scrub Tk queues motion events faster than
+    the loop body redraws, so the rubber band lags behind the cursor. When a
+    coalescable event arrives, zero-timeout reads drain any immediately
+    following repeats and keep only the newest values dict, letting one
+    redraw cover the whole burst. The first different event ends the drain
+    and is stashed for the next loop pass.
+    """
+    global _pending_event
+
+    if _pending_event is not None:
+        event, values = _pending_event
+        _pending_event = None
+        return event, values
+
+    event, values = window.read(timeout=timeout)
+    if event not in COALESCED_EVENTS:
+        return event, values
+
+    while True:
+        next_event, next_values = window.read(timeout=0)
+        if next_event == event:
+            values = next_values
+            continue
+        if next_event != sg.TIMEOUT_EVENT:
+            _pending_event = (next_event, next_values)
+        return event, values
 
-window.is_drawing = False
 
 # --- Event Loop ---
 while True:
-    event, values = window.read(timeout=50)
+    # Poll fast only while something can actually arrive on gui_queue (worker
+    # process or preview decode running) or a debounced save is pending;
+    # otherwise one wakeup per half second. Fully blocking reads are not an
+    # option because worker results travel over gui_queue — write_event_value
+    # crashes during graph drawing (PySimpleGUI issue 5750).
+    if (window.is_processing or window._videocr_process_pid or window.decode_pending
+            or window.pending_save_deadline is not None or not gui_queue.empty()):
+        read_timeout = 50
+    else:
+        read_timeout = 500
+
+    event, values = read_event_coalesced(window, timeout=read_timeout)
 
     # --- Failsafe Event Override ---
-    if getattr(window, 'needs_mouse_up', False):
+    if window.needs_mouse_up:
         if event in [sg.TIMEOUT_EVENT, "-GRAPH-+MOVE"]:
             window.needs_mouse_up = False
             event = "-GRAPH-+UP"
 
     # --- POLL QUEUE ---
     # window.write_event_value is causing crashes while drawing graph elements. See https://github.com/PySimpleGUI/PySimpleGUI/issues/5750
-    if not window.is_drawing:
+    # The empty() pre-check keeps the idle path free of a queue.Empty raise per tick;
+    # with a single consumer a stale answer only delays a message to the next tick.
+    if not window.is_drawing and not gui_queue.empty():
         try:
             while True:
                 msg_event, msg_data = gui_queue.get_nowait()
-
-                if msg_event == '-PROCESS_STARTED-':
-                    window._videocr_process_pid = msg_data
-                    window['-BTN-RUN-'].update(disabled=True)
-                    window['-BTN-CANCEL-'].update(disabled=False)
-                    window['-BTN-BATCH-STOP-'].update(disabled=False)
-
-                elif msg_event == '-PROGRESS-SMOOTH-':
-                    if msg_data.get('text'):
-                        window['-STATUS-LINE-'].update(msg_data['text'])
-                    if msg_data.get('eta'):
-                        window['-ETA-LINE-'].update(msg_data['eta'])
-                    if msg_data.get('percent') is not None:
-                        window['-PROGRESS-BAR-'].update(msg_data['percent'])
-
-                elif msg_event == '-VIDEOCR_OUTPUT-':
-                    text_to_log = msg_data
-                    if text_to_log.strip():
-                        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-                        final_text = f"[{timestamp}] {text_to_log}"
-                    else:
-                        final_text = text_to_log
-                    window['-OUTPUT-'].update(final_text, append=True)
-
-                elif msg_event == '-TASKBAR_STATE_UPDATE-':
-                    update_taskbar(state=msg_data.get('state'), progress=msg_data.get('progress'))
-
-                elif msg_event == '-NOTIFICATION_EVENT-':
-                    send_notification(msg_data['title'], msg_data['message'])
-
-                elif msg_event == '-BATCH-REFRESH-':
-                    refresh_batch_table(window)
-
-                elif msg_event == '-BATCH-FINISHED-':
-                    window.is_processing = False
-                    set_system_awake(False)
-
-                    for btn in ['-BTN-BATCH-START-', '-BTN-RUN-']:
-                        window[btn].update(disabled=False)
-
-                    window['-BTN-BATCH-PAUSE-'].update(disabled=True, text=LANG.get('btn_pause', "Pause"))
-                    window['-BTN-PAUSE-'].update(disabled=True, text=LANG.get('btn_pause', "Pause"))
-                    window['-BTN-CANCEL-'].update(disabled=True)
-                    window['-BTN-BATCH-STOP-'].update(disabled=True)
-                    window['-SAVE_AS_BTN-'].update(disabled=not video_path)
-                    window['--output'].update(disabled=not video_path)
-                    window['-PROGRESS-BAR-'].update(0)
-                    window['-STATUS-LINE-'].update("")
-                    window['-ETA-LINE-'].update("")
-                    msg = LANG.get('status_queue_cancelled', "Queue Cancelled") if getattr(window, 'cancelled_by_user', False) else LANG.get('status_queue_finished', "Queue Finished")
-                    window['-OUTPUT-'].update('\n', append=True)
-                    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-                    window['-OUTPUT-'].update(f"[{timestamp}] {msg}\n", append=True)
-
-                    if hasattr(window, '_videocr_process_pid'):
-                        del window._videocr_process_pid
-
-                    update_taskbar(state='normal', progress=0)
-                    update_run_and_cancel_button_state(window, batch_queue)
-                    execute_post_completion_action(window, icon=ICON_PATH)
-
-                    if hasattr(window, 'cancelled_by_user'):
-                        del window.cancelled_by_user
+                msg_handler = GUI_QUEUE_HANDLERS.get(msg_event)
+                if msg_handler:
+                    msg_handler(window, msg_data)
 
         except queue.Empty:
             pass
 
+    # Trailing-edge autosave debounce: a burst of keystrokes in a tracked
+    # field schedules one config write 500 ms after the last change.
+    if window.pending_save_values is not None and window.pending_save_deadline is not None and time.monotonic() >= window.pending_save_deadline:
+        save_settings(window, window.pending_save_values)
+        window.pending_save_values = None
+        window.pending_save_deadline = None
+
+    # The 50ms read timeout makes the timeout event by far the most frequent one;
+    # none of the branches below handle it, so skip the whole chain.
+    if event == sg.TIMEOUT_EVENT:
+        continue
+
     # --- Save settings ---
-    if event in KEYS_TO_AUTOSAVE:
+    if event in AUTOSAVE_KEY_SET:
         if values is not None:
-            save_settings(window, values)
+            settings_sig = tuple(values.get(key) for key in KEYS_TO_AUTOSAVE)
+            if settings_sig != last_settings_sig:
+                last_settings_sig = settings_sig
+                window.pending_save_values = values
+                window.pending_save_deadline = time.monotonic() + 0.5
 
         if event == '--brightness_threshold':
             if video_path and video_duration_ms > 0:
                 bt = get_valid_brightness_threshold(values.get('--brightness_threshold'))
-                img_bytes, res_w, res_h, off_x, off_y = video_manager.get_frame(current_time_ms, graph_size, brightness_threshold=bt)
-
-                if img_bytes:
-                    resized_frame_width, resized_frame_height = res_w, res_h
-                    image_offset_x, image_offset_y = off_x, off_y
-                    current_image_bytes = img_bytes.getvalue()
-                    redraw_canvas_and_boxes()
+                request_preview_frame(video_path, current_time_ms, graph_size, bt)
+                window.last_edit_key = None
 
         if event in ('enable_subtitle_alignment', '--use_dual_zone'):
             update_alignment_controls(window, values)
@@ -2902,8 +3710,7 @@ while True:
         if event == '--use_dual_zone' or event == '--use_fullframe':
             reset_crop_state()
             if video_path and current_image_bytes:
-                graph.erase()
-                graph.draw_image(data=current_image_bytes, location=(image_offset_x, image_offset_y))
+                redraw_canvas_and_boxes()
             save_settings(window, values)
 
         # --- Handle possible output path change ---
@@ -2984,11 +3791,23 @@ while True:
 
             save_settings(window, values)
 
+    # O(1) dispatch for the self-contained handlers; stateful branches follow.
+    dispatch_handler = EVENT_DISPATCH.get(event)
+    if dispatch_handler:
+        dispatch_handler(window, values)
+        continue
+
     if event == sg.WIN_CLOSED:
+        # Flush a debounced autosave that has not hit its deadline yet.
+        if window.pending_save_values is not None:
+            save_settings(window, window.pending_save_values)
+            window.pending_save_values = None
+            window.pending_save_deadline = None
+
         video_manager.close()
         set_system_awake(False)
 
-        process_to_kill = getattr(window, '_videocr_process_pid', None)
+        process_to_kill = window._videocr_process_pid
         if process_to_kill:
             try:
                 kill_process_tree(process_to_kill)
@@ -3002,7 +3821,15 @@ while True:
         lang_code = available_languages.get(selected_native_name)
 
         if lang_code:
-            current_resume_text = LANG.get('btn_resume', "Resume")
+            # Flush a pending debounced autosave before LANG swaps: its values
+            # snapshot holds old-language display strings that save_settings
+            # could no longer map back to internal values afterwards.
+            if window.pending_save_values is not None:
+                save_settings(window, window.pending_save_values)
+                window.pending_save_values = None
+                window.pending_save_deadline = None
+
+            current_resume_text = _L.btn_resume
             was_paused = window['-BTN-PAUSE-'].get_text() == current_resume_text
 
             selected_pos_display_name = values['-SUBTITLE_POS_COMBO-']
@@ -3024,10 +3851,17 @@ while True:
         restart_choice = custom_popup_yes_no(window, title, message, icon=ICON_PATH)
 
         if restart_choice == 'Yes':
+            # Flush a debounced autosave that has not hit its deadline yet,
+            # so the new scaling factor survives the restart.
+            if window.pending_save_values is not None:
+                save_settings(window, window.pending_save_values)
+                window.pending_save_values = None
+                window.pending_save_deadline = None
+
             video_manager.close()
             set_system_awake(False)
 
-            process_to_kill = getattr(window, '_videocr_process_pid', None)
+            process_to_kill = window._videocr_process_pid
             if process_to_kill:
                 try:
                     kill_process_tree(process_to_kill)
@@ -3045,120 +3879,19 @@ while True:
             break
 
     # --- File/Folder Handling ---
-    elif event == '-BTN-OPEN-FILE-':
-        video_file_types = LANG.get('video_file_types', "Video Files")
-        all_file_types = LANG.get('all_file_types', "All Files")
-        filename = sg.tk.filedialog.askopenfilename(
-            filetypes=((video_file_types, "*.mp4 *.avi *.mkv *.mov *.webm *.flv *.wmv *.ts *.m2ts"), (all_file_types, "*.*")),
-            parent=window.TKroot
-        )
-        if filename:
-            window['-VIDEO-LIST-'].update(value=filename, values=[filename], size=(38, None), disabled=False)
-            window.write_event_value('-VIDEO-LIST-', filename)
-
-    elif event == '-BTN-OPEN-FOLDER-':
-        folder = sg.tk.filedialog.askdirectory(parent=window.TKroot)
-        if folder:
-            videos = scan_video_folder(folder)
-            if videos:
-                window['-VIDEO-LIST-'].update(value=videos[0], values=videos, size=(38, None), disabled=False)
-                window.write_event_value('-VIDEO-LIST-', videos[0])
-            else:
-                custom_popup(window, "No Videos", "No supported videos found in folder.", icon=ICON_PATH)
-
-    elif event == '-BTN-FOLDER_BROWSE-':
-        folder = sg.tk.filedialog.askdirectory()
-        if folder:
-            window['--default_output_dir'].update(folder)
-
-    elif event == '-BTN-OCR-INFO-':
-        custom_popup(window, LANG.get('engine_info', "OCR Engine Information"), LANG.get('engine_message', (
-            "PaddleOCR (Det. + Rec.):\n"
-            "• 100% local processing.\n"
-            "• Both text detection and recognition are done locally.\n\n"
-            "PaddleOCR (Det.) + Google Lens (Rec.):\n"
-            "• Hybrid processing.\n"
-            "• PaddleOCR handles text detection locally.\n"
-            "• Google Lens (online) handles text recognition.\n"
-            "• Requires an active internet connection.")),
-            icon=ICON_PATH
-        )
-
-    elif event == '-NEW_VERSION_FOUND-':
-        update_popup(
-            parent_window=window,
-            version_info=values[event],
-            current_version=PROGRAM_VERSION,
-            icon=ICON_PATH
-        )
-
-    elif event == '-BTN-CHECK_UPDATE_MANUAL-':
-        threading.Thread(target=check_for_updates, args=(window, True), daemon=True).start()
-
-    elif event == '-NO_UPDATE_FOUND-':
-        custom_popup(window, LANG.get('update_title_uptodate', "Up to Date"), LANG.get('update_msg_uptodate', "You are running the latest version of VideOCR."), icon=ICON_PATH)
-
-    elif event == '-UPDATE_CHECK_FAILED-':
-        custom_popup(window, LANG.get('update_title_error', "Error"), LANG.get('update_msg_error', "Failed to check for updates.\nPlease check your internet connection."), icon=ICON_PATH)
-
-    elif event == '-TABGROUP-' and values.get('-TABGROUP-') == '-TAB-VIDEO-':
-        if '-GRAPH-' in window.AllKeysDict:
-            window['-GRAPH-'].set_focus()
-
-    elif event == "-BTN-HELP-":
-        custom_popup(window, LANG.get('help_title', "Cropping Info"), LANG.get('help_message', (
-            "Draw a crop box over the subtitle region in the video.\n"
-            "Use click+drag to select.\n"
-            "In 'Dual Zone' mode, you can draw two crop boxes.\n"
-            "If no crop box is selected, the bottom third of the video\n"
-            "will be used for OCR by default.")),
-            icon=ICON_PATH
-        )
-
-    elif event == "-GITHUB_ISSUES_LINK-":
-        webbrowser.open("https://github.com/timminator/VideOCR/issues")
-
-    elif event == "-GITHUB_RELEASES_LINK-":
-        webbrowser.open("https://github.com/timminator/VideOCR/releases")
-
-    elif event == '-SAVE_AS_BTN-':
-        output_path = values["--output"]
-        output_file_path = pathlib.Path(output_path)
-
-        save_as_title = LANG.get('save_as_title', "Save As")
-        save_as_filter_name = LANG.get('save_as_filter_name', "SubRip Subtitle")
-        save_as_all_files = LANG.get('save_as_all_files', "All Files")
-
-        # Usage of tkinter.tkFileDialog instead of sg.popup_get_file because of the window placement on screen
-        filename_chosen = sg.tk.filedialog.asksaveasfilename(
-            defaultextension='srt',
-            filetypes=((save_as_filter_name, "*.srt"), (save_as_all_files, "*.*")),
-            initialdir=output_file_path.parent,
-            initialfile=output_file_path.stem,
-            parent=window.TKroot,
-            title=save_as_title
-        )
-
-        if filename_chosen != "":
-            window["--output"].update(filename_chosen)
-
-    elif event == '-WINDOW_RESTORED-':
-        if '-GRAPH-' in window.AllKeysDict:
-            window['-GRAPH-'].set_focus()
-
     # --- Load Video Logic ---
     elif event == "-VIDEO-LIST-":
         video_path = values["-VIDEO-LIST-"]
         window['-BTN-RUN-'].update(disabled=True)
         window["-SLIDER-"].update(disabled=True)
 
-        time_text_empty = LANG.get('time_text_empty', 'Time: -/-')
+        time_text_empty = _L.time_text_empty
         window["-TIME_TEXT-"].update(time_text_empty)
         window['--output'].update("", disabled=True)
         window['-SAVE_AS_BTN-'].update(disabled=True)
 
         reset_crop_state()
-        graph.erase()
+        clear_graph()
 
         orig_w, orig_h, duration_ms = video_manager.open(video_path).values()
 
@@ -3169,7 +3902,7 @@ while True:
             current_time_ms = 0.0
 
             bt = get_valid_brightness_threshold(values.get('--brightness_threshold'))
-            img_bytes, res_w, res_h, off_x, off_y = video_manager.get_frame(0, graph_size, brightness_threshold=bt)
+            img_bytes, res_w, res_h, off_x, off_y = get_first_frame(video_manager, video_path, graph_size, brightness_threshold=bt)
 
             if img_bytes:
                 resized_frame_width = res_w
@@ -3178,7 +3911,7 @@ while True:
                 image_offset_y = off_y
                 current_image_bytes = img_bytes.getvalue()
 
-                graph.draw_image(data=current_image_bytes, location=(image_offset_x, image_offset_y))
+                sync_base_image()
                 window["-SLIDER-"].update(range=(0, video_duration_ms), value=0, disabled=False)
                 update_time_display(window, 0, video_duration_ms)
 
@@ -3186,12 +3919,12 @@ while True:
                     output_path = generate_output_path(video_path, values)
 
                     window['--output'].update(str(output_path))
-                    if not getattr(window, 'is_processing', False):
+                    if not window.is_processing:
                         window['-BTN-RUN-'].update(disabled=False)
                         window['-SAVE_AS_BTN-'].update(disabled=False)
 
-                    if '-GRAPH-' in window.AllKeysDict:
-                        window['-GRAPH-'].set_focus()
+                    if HAS_GRAPH:
+                        graph.set_focus()
 
                 except Exception as e:
                     popup_title = LANG.get('error_set_path_title', "Unable to Set Output Path")
@@ -3211,10 +3944,10 @@ while True:
                             continue
 
                         abs_coords = {
-                            'crop_x': math.floor(rel_coords.get('crop_x', 0) * original_frame_width),
-                            'crop_y': math.floor(rel_coords.get('crop_y', 0) * original_frame_height),
-                            'crop_width': math.ceil(rel_coords.get('crop_width', 0) * original_frame_width),
-                            'crop_height': math.ceil(rel_coords.get('crop_height', 0) * original_frame_height),
+                            'crop_x': floor_int(rel_coords.get('crop_x', 0) * original_frame_width),
+                            'crop_y': floor_int(rel_coords.get('crop_y', 0) * original_frame_height),
+                            'crop_width': ceil_int(rel_coords.get('crop_width', 0) * original_frame_width),
+                            'crop_height': ceil_int(rel_coords.get('crop_height', 0) * original_frame_height),
                         }
 
                         scale_w = resized_frame_width / original_frame_width if original_frame_width > 0 else 0
@@ -3238,17 +3971,7 @@ while True:
                     if window.crop_boxes:
                         redraw_canvas_and_boxes()
 
-                        if not use_dual_zone:
-                            b = window.crop_boxes[0]
-                            coord_text = f"({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})"
-                        else:
-                            coords_str_parts = []
-                            zone_text = LANG.get('crop_zone_text', "Zone")
-                            for i, b in enumerate(window.crop_boxes):
-                                coords_str_parts.append(f"{zone_text} {i + 1}: ({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})")
-                            coord_text = "  |  ".join(coords_str_parts)
-
-                        window['-CROP_COORDS-'].update(coord_text)
+                        window['-CROP_COORDS-'].update(format_crop_coord_text(window.crop_boxes, use_dual_zone))
                         window["-BTN-CLEAR_CROP-"].update(disabled=False)
 
         else:
@@ -3264,15 +3987,8 @@ while True:
         if abs(new_time_ms - current_time_ms) > 50:
             current_time_ms = new_time_ms
             bt = get_valid_brightness_threshold(values.get('--brightness_threshold'))
-            img_bytes, res_w, res_h, off_x, off_y = video_manager.get_frame(current_time_ms, graph_size, brightness_threshold=bt)
-
-            if img_bytes:
-                resized_frame_width, resized_frame_height = res_w, res_h
-                image_offset_x, image_offset_y = off_x, off_y
-                current_image_bytes = img_bytes.getvalue()
-
-                redraw_canvas_and_boxes()
-                update_time_display(window, current_time_ms, video_duration_ms)
+            request_preview_frame(video_path, current_time_ms, graph_size, bt)
+            update_time_display(window, current_time_ms, video_duration_ms)
 
     # --- Handle Keyboard Arrow Keys (Bound to Graph) ---
     elif event in ('-GRAPH-<Left>', '-GRAPH-<Right>'):
@@ -3311,6 +4027,12 @@ while True:
         img_x = graph_x - image_offset_x
         img_y = graph_y - image_offset_y
 
+        # Tk repeats motion events while the pointer sits still mid-drag;
+        # identical coordinates cannot change any box, so skip the redraw.
+        if (img_x, img_y) == window.last_drag_point and (window.start_point_img is not None or window.resize_state is not None):
+            continue
+        window.last_drag_point = (img_x, img_y)
+
         # Initiating a click
         if window.start_point_img is None and window.resize_state is None:
             if window.hover_state:
@@ -3347,8 +4069,8 @@ while True:
                 box_w = x2 - x1
                 box_h = y2 - y1
 
-                x1 = max(0, min(resized_frame_width - box_w, x1 + dx))
-                y1 = max(0, min(resized_frame_height - box_h, y1 + dy))
+                x1 = clamp(x1 + dx, 0, resized_frame_width - box_w)
+                y1 = clamp(y1 + dy, 0, resized_frame_height - box_h)
                 x2 = x1 + box_w
                 y2 = y1 + box_h
 
@@ -3356,8 +4078,8 @@ while True:
                 window.resize_state['last_y'] = img_y
             else:
                 # Edge Resizing
-                img_x_c = max(0, min(resized_frame_width, img_x))
-                img_y_c = max(0, min(resized_frame_height, img_y))
+                img_x_c = clamp(img_x, 0, resized_frame_width)
+                img_y_c = clamp(img_y, 0, resized_frame_height)
 
                 if 'left' in edge:
                     x1 = img_x_c
@@ -3373,8 +4095,8 @@ while True:
 
         # Drawing
         else:
-            img_x_c = max(0, min(resized_frame_width, img_x))
-            img_y_c = max(0, min(resized_frame_height, img_y))
+            img_x_c = clamp(img_x, 0, resized_frame_width)
+            img_y_c = clamp(img_y, 0, resized_frame_height)
 
             window.end_point_img = (img_x_c, img_y_c)
             redraw_boxes()
@@ -3382,6 +4104,16 @@ while True:
     # --- Graph Interaction Release ---
     elif event == "-GRAPH-+UP":
         window.is_drawing = False
+        # Manual box changes invalidate the edit shortcut for the last restored job.
+        window.last_edit_key = None
+        use_dual_zone = values.get('--use_dual_zone', False)
+
+        # Display-to-source scale factors, divided once for the whole handler.
+        if resized_frame_width > 0 and resized_frame_height > 0:
+            scale_to_src_x = original_frame_width / resized_frame_width
+            scale_to_src_y = original_frame_height / resized_frame_height
+        else:
+            scale_to_src_x = scale_to_src_y = 0.0
 
         # Finish Resizing
         if window.resize_state:
@@ -3394,10 +4126,10 @@ while True:
             rect_x2_img = max(p1[0], p2[0])
             rect_y2_img = max(p1[1], p2[1])
 
-            crop_x = math.floor(rect_x1_img * original_frame_width / resized_frame_width)
-            crop_y = math.floor(rect_y1_img * original_frame_height / resized_frame_height)
-            crop_w = math.ceil((rect_x2_img - rect_x1_img) * original_frame_width / resized_frame_width)
-            crop_h = math.ceil((rect_y2_img - rect_y1_img) * original_frame_height / resized_frame_height)
+            crop_x = floor_int(rect_x1_img * scale_to_src_x)
+            crop_y = floor_int(rect_y1_img * scale_to_src_y)
+            crop_w = ceil_int((rect_x2_img - rect_x1_img) * scale_to_src_x)
+            crop_h = ceil_int((rect_y2_img - rect_y1_img) * scale_to_src_y)
 
             box['coords'] = {'crop_x': crop_x, 'crop_y': crop_y, 'crop_width': crop_w, 'crop_height': crop_h}
             box['img_points'] = ((rect_x1_img, rect_y1_img), (rect_x2_img, rect_y2_img))
@@ -3405,17 +4137,7 @@ while True:
             window.resize_state = None
             redraw_canvas_and_boxes()
 
-            if not values.get('--use_dual_zone', False):
-                b = window.crop_boxes[0]
-                coord_text = f"({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})"
-            else:
-                coords_str_parts = []
-                zone_text = LANG.get('crop_zone_text', "Zone")
-                for i, b in enumerate(window.crop_boxes):
-                    coords_str_parts.append(f"{zone_text} {i + 1}: ({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})")
-                coord_text = "  |  ".join(coords_str_parts)
-
-            window['-CROP_COORDS-'].update(coord_text)
+            window['-CROP_COORDS-'].update(format_crop_coord_text(window.crop_boxes, use_dual_zone))
             save_settings(window, values)
 
         # Finish Drawing
@@ -3439,10 +4161,10 @@ while True:
                 save_settings(window, values)
                 continue
 
-            crop_x = math.floor(rect_x1_img * original_frame_width / resized_frame_width)
-            crop_y = math.floor(rect_y1_img * original_frame_height / resized_frame_height)
-            crop_w = math.ceil((rect_x2_img - rect_x1_img) * original_frame_width / resized_frame_width)
-            crop_h = math.ceil((rect_y2_img - rect_y1_img) * original_frame_height / resized_frame_height)
+            crop_x = floor_int(rect_x1_img * scale_to_src_x)
+            crop_y = floor_int(rect_y1_img * scale_to_src_y)
+            crop_w = ceil_int((rect_x2_img - rect_x1_img) * scale_to_src_x)
+            crop_h = ceil_int((rect_y2_img - rect_y1_img) * scale_to_src_y)
 
             new_box = {
                 'coords': {'crop_x': crop_x, 'crop_y': crop_y, 'crop_width': crop_w, 'crop_height': crop_h},
@@ -3452,17 +4174,7 @@ while True:
 
             redraw_canvas_and_boxes()
 
-            if not values.get('--use_dual_zone', False):
-                b = window.crop_boxes[0]
-                coord_text = f"({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})"
-            else:
-                coords_str_parts = []
-                zone_text = LANG.get('crop_zone_text', "Zone")
-                for i, b in enumerate(window.crop_boxes):
-                    coords_str_parts.append(f"{zone_text} {i + 1}: ({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})")
-                coord_text = "  |  ".join(coords_str_parts)
-
-            window['-CROP_COORDS-'].update(coord_text)
+            window['-CROP_COORDS-'].update(format_crop_coord_text(window.crop_boxes, use_dual_zone))
             window["-BTN-CLEAR_CROP-"].update(disabled=False)
 
             save_settings(window, values)
@@ -3492,12 +4204,7 @@ while True:
             continue
 
         target_output_full = args['output']
-        existing_job_index = -1
-
-        for idx, job in enumerate(batch_queue):
-            if job['args']['output'] == target_output_full:
-                existing_job_index = idx
-                break
+        existing_job_index = queue_index_by_output.get(target_output_full, -1)
 
         should_create_new = True
 
@@ -3561,7 +4268,7 @@ while True:
                 skipped_videos.append(f"{os.path.basename(v_path)} ({LANG.get('reason_dup_path', 'Duplicate Output path')})")
                 continue
 
-            _, _, duration_ms = video_manager.open(v_path).values()
+            duration_ms = probe_video(v_path)['duration_ms']
             if duration_ms <= 0:
                 skipped_videos.append(f"{os.path.basename(v_path)} ({LANG.get('reason_metadata', 'Metadata Error')})")
                 continue
@@ -3613,7 +4320,7 @@ while True:
         start_queue(window, batch_queue)
 
     elif event == "-BTN-RUN-":
-        is_batch_start = window['-BTN-RUN-'].get_text() == LANG.get('btn_start_queue', "Start Queue")
+        is_batch_start = window['-BTN-RUN-'].get_text() == _L.btn_start_queue
 
         if is_batch_start:
             if window['prevent_system_sleep'].get():
@@ -3624,26 +4331,20 @@ while True:
             if not video_path:
                 continue
 
-            if hasattr(window, '_videocr_process_pid') and window._videocr_process_pid:
+            if window._videocr_process_pid:
                 window['-OUTPUT-'].update(LANG.get('error_already_running', "Process is already running.\n"), append=True)
                 continue
 
             args, errors = get_processing_args(values, window)
             if errors or args is None:
                 errors_to_display = errors if errors is not None else ["Unknown validation error"]
-                window['-OUTPUT-'].update(LANG.get('val_err_header', "Validation Errors:\n"), append=True)
-                for error in errors_to_display:
-                    window['-OUTPUT-'].update(f"- {error}\n", append=True)
-                window.refresh()
+                header = LANG.get('val_err_header', "Validation Errors:\n")
+                output_log.write(header + ''.join(f"- {error}\n" for error in errors_to_display))
+                output_log.flush()
                 continue
 
             target_output_full = args['output']
-            existing_job_index = -1
-
-            for idx, job in enumerate(batch_queue):
-                if job['args']['output'] == target_output_full:
-                    existing_job_index = idx
-                    break
+            existing_job_index = queue_index_by_output.get(target_output_full, -1)
 
             should_create_new = True
 
@@ -3677,43 +4378,37 @@ while True:
             start_queue(window, batch_queue)
 
     elif event in ("-BTN-BATCH-PAUSE-", "-BTN-PAUSE-"):
-        pid = getattr(window, '_videocr_process_pid', None)
+        pid = window._videocr_process_pid
         if not pid:
             continue
 
-        is_currently_paused = window[event].get_text() == LANG.get('btn_resume', "Resume")
+        is_currently_paused = window[event].get_text() == _L.btn_resume
 
         if is_currently_paused:
             if window['prevent_system_sleep'].get():
                 set_system_awake(True)
 
             if set_process_pause_state(pid, pause=False):
-                for key in ('-BTN-PAUSE-', '-BTN-BATCH-PAUSE-'):
-                    if key in window.AllKeysDict:
-                        window[key].update(text=LANG.get('btn_pause', "Pause"))
+                with batched_updates(window) as update_elem:
+                    for key in PAUSE_BUTTON_KEYS:
+                        update_elem(key, text=_L.btn_pause)
 
-                window['-OUTPUT-'].update(LANG.get('status_resuming', "\nResuming process...\n"), append=True)
+                output_log.write(_L.status_resuming)
                 update_taskbar(state='normal')
 
-                for job in batch_queue:
-                    if job['status'] == 'Paused':
-                        job['status'] = 'Processing'
-                        break
+                set_active_job_status(window, 'Processing', 'Paused')
         else:
             set_system_awake(False)
 
             if set_process_pause_state(pid, pause=True):
-                for key in ('-BTN-PAUSE-', '-BTN-BATCH-PAUSE-'):
-                    if key in window.AllKeysDict:
-                        window[key].update(text=LANG.get('btn_resume', "Resume"))
+                with batched_updates(window) as update_elem:
+                    for key in PAUSE_BUTTON_KEYS:
+                        update_elem(key, text=_L.btn_resume)
 
-                window['-OUTPUT-'].update(LANG.get('status_pausing', "\nPausing process...\n"), append=True)
+                output_log.write(_L.status_pausing)
                 update_taskbar(state='paused')
 
-                for job in batch_queue:
-                    if job['status'] == 'Processing':
-                        job['status'] = 'Paused'
-                        break
+                set_active_job_status(window, 'Paused', 'Processing')
 
         refresh_batch_table(window)
 
@@ -3736,8 +4431,8 @@ while True:
                 custom_popup(window, LANG.get('title_error', "Error"), LANG.get('popup_cannot_remove_running', "The currently running or paused job cannot be removed.\nPlease stop or cancel the process first."), icon=ICON_PATH)
                 continue
 
-            for i in sorted(rows, reverse=True):
-                del batch_queue[i]
+            row_set = set(rows)
+            batch_queue[:] = [job for i, job in enumerate(batch_queue) if i not in row_set]
 
             refresh_batch_table(window)
             update_run_and_cancel_button_state(window, batch_queue)
@@ -3858,7 +4553,7 @@ while True:
             args = job['args']
             v_path = args['video_path']
 
-            if not os.path.exists(v_path):
+            if not path_exists(v_path):
                 error_title = LANG.get('title_error', "Error")
                 error_msg = LANG.get('error_video_not_found', "Video file not found:\n{}").format(v_path)
                 custom_popup(window, error_title, error_msg, icon=ICON_PATH)
@@ -3867,12 +4562,29 @@ while True:
             window['-TABGROUP-'].Widget.select(0)
             window['-VIDEO-LIST-'].update(value=v_path)
 
+            bt = get_valid_brightness_threshold(args.get('brightness_threshold'))
+            edit_key = (
+                v_path, bt,
+                args.get('crop_x'), args.get('crop_y'), args.get('crop_width'), args.get('crop_height'),
+                args.get('use_dual_zone'), args.get('crop_x2'), args.get('crop_y2'),
+                args.get('crop_width2'), args.get('crop_height2'),
+            )
+
+            # The graph already shows this job's frame and boxes; restoring the
+            # settings widgets is enough, and skipping the erase/redraw avoids a
+            # visible flicker.
+            if edit_key == window.last_edit_key and video_path == v_path and current_image_bytes and current_time_ms == 0.0:
+                restore_job_settings(window, args)
+                del batch_queue[idx]
+                refresh_batch_table(window)
+                update_run_and_cancel_button_state(window, batch_queue)
+                continue
+
             reset_crop_state()
-            graph.erase()
+            clear_graph()
 
             orig_w, orig_h, duration_ms = video_manager.open(v_path).values()
-            bt = get_valid_brightness_threshold(args.get('brightness_threshold'))
-            img_bytes, res_w, res_h, off_x, off_y = video_manager.get_frame(0, graph_size, brightness_threshold=bt)
+            img_bytes, res_w, res_h, off_x, off_y = get_first_frame(video_manager, v_path, graph_size, brightness_threshold=bt)
 
             if img_bytes and duration_ms > 0:
                 video_path = v_path
@@ -3886,7 +4598,7 @@ while True:
                 image_offset_y = off_y
                 current_image_bytes = img_bytes.getvalue()
 
-                graph.draw_image(data=current_image_bytes, location=(image_offset_x, image_offset_y))
+                sync_base_image()
 
                 window["-SLIDER-"].update(range=(0, video_duration_ms), value=0, disabled=False)
                 update_time_display(window, 0, video_duration_ms)
@@ -3894,60 +4606,23 @@ while True:
                 window['-SAVE_AS_BTN-'].update(disabled=False)
 
                 # --- RESTORE SETTINGS ---
-                window['--output'].update(args.get('output', ''))
-
-                # Restore Engine selection
-                saved_engine = args.get('ocr_engine', 'paddleocr')
-                if saved_engine == 'google_lens':
-                    engine_display = OCR_ENGINES[1]
-                    active_lang_list = lens_display_names
-                    lookup = lens_abbr_lookup
-                else:
-                    engine_display = OCR_ENGINES[0]
-                    active_lang_list = paddle_display_names
-                    lookup = paddle_abbr_lookup
-
-                window['-OCR_ENGINE_COMBO-'].update(value=engine_display)
-
-                # Restore Language based on the restored engine
-                saved_lang_abbr = args.get('lang', 'en')
-                disp_name = next((k for k, v in lookup.items() if v == saved_lang_abbr), DEFAULT_SUBTITLE_LANGUAGE)
-                window['-LANG_COMBO-'].update(values=active_lang_list, value=disp_name)
-
-                # Restore remaining simple arguments
-                for arg_key, arg_val in args.items():
-                    if arg_key in ('ocr_engine', 'lang'):
-                        continue
-                    gui_key = f"--{arg_key}"
-                    if gui_key in window.AllKeysDict:
-                        window[gui_key].update(arg_val)
+                restore_job_settings(window, args)
 
                 new_boxes: list[dict[str, Any]] = []
 
-                def restore_box(cx: float, cy: float, cw: float, ch: float, orig_w: int, orig_h: int, res_w: int, res_h: int) -> dict[str, Any]:
-                    sx = res_w / orig_w if orig_w > 0 else 0
-                    sy = res_h / orig_h if orig_h > 0 else 0
-
-                    rx1 = cx * sx
-                    ry1 = cy * sy
-                    rx2 = (cx + cw) * sx
-                    ry2 = (cy + ch) * sy
-
-                    return {
-                        'coords': {'crop_x': int(cx), 'crop_y': int(cy), 'crop_width': int(cw), 'crop_height': int(ch)},
-                        'img_points': ((rx1, ry1), (rx2, ry2))
-                    }
+                scale_x = resized_frame_width / original_frame_width if original_frame_width > 0 else 0
+                scale_y = resized_frame_height / original_frame_height if original_frame_height > 0 else 0
 
                 if 'crop_x' in args:
-                    new_boxes.append(restore_box(
+                    new_boxes.append(restore_crop_box(
                         args['crop_x'], args['crop_y'], args['crop_width'], args['crop_height'],
-                        original_frame_width, original_frame_height, resized_frame_width, resized_frame_height
+                        scale_x, scale_y
                     ))
 
                 if args.get('use_dual_zone') and 'crop_x2' in args:
-                    new_boxes.append(restore_box(
+                    new_boxes.append(restore_crop_box(
                         args['crop_x2'], args['crop_y2'], args['crop_width2'], args['crop_height2'],
-                        original_frame_width, original_frame_height, resized_frame_width, resized_frame_height
+                        scale_x, scale_y
                     ))
 
                 window.crop_boxes = new_boxes
@@ -3956,18 +4631,11 @@ while True:
                 if not new_boxes:
                     window['-CROP_COORDS-'].update("Not Set")
                     window["-BTN-CLEAR_CROP-"].update(disabled=True)
-                elif len(new_boxes) == 1:
-                    b = new_boxes[0]
-                    window['-CROP_COORDS-'].update(f"({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})")
-                    window["-BTN-CLEAR_CROP-"].update(disabled=False)
                 else:
-                    coords_str_parts = []
-                    zone_text = LANG.get('crop_zone_text', "Zone")
-                    for i, b in enumerate(new_boxes):
-                        coords_str_parts.append(f"{zone_text} {i + 1}: ({b['coords']['crop_x']}, {b['coords']['crop_y']}, {b['coords']['crop_width']}, {b['coords']['crop_height']})")
-                    window['-CROP_COORDS-'].update("  |  ".join(coords_str_parts))
+                    window['-CROP_COORDS-'].update(format_crop_coord_text(new_boxes, len(new_boxes) > 1))
                     window["-BTN-CLEAR_CROP-"].update(disabled=False)
 
+                window.last_edit_key = edit_key
                 del batch_queue[idx]
                 refresh_batch_table(window)
                 update_run_and_cancel_button_state(window, batch_queue)
@@ -3976,31 +4644,32 @@ while True:
     elif event == "-BTN-CLEAR_CROP-":
         reset_crop_state()
         if video_path and current_image_bytes:
-            graph.erase()
-            graph.draw_image(data=current_image_bytes, location=(image_offset_x, image_offset_y))
+            redraw_canvas_and_boxes()
         save_settings(window, values)
 
     # --- Cancel Button Clicked ---
     elif event in ("-BTN-CANCEL-", "-BTN-BATCH-STOP-"):
-        pid_to_kill = getattr(window, '_videocr_process_pid', None)
+        pid_to_kill = window._videocr_process_pid
         if pid_to_kill:
             window.cancelled_by_user = True
-            window['-OUTPUT-'].update(LANG.get('status_cancelling', "\nCancelling process...\n"), append=True)
-            window.refresh()
+            output_log.write(_L.status_cancelling)
+            output_log.flush()
+            # Paint the pending redraw without pumping the full Tk event queue; the
+            # status only needs to show before the blocking kill below.
+            window.TKroot.update_idletasks()
             try:
-                if window['-BTN-PAUSE-'].get_text() == LANG.get('btn_resume', "Resume"):
+                if window['-BTN-PAUSE-'].get_text() == _L.btn_resume:
                     set_process_pause_state(pid_to_kill, pause=False)
 
                 kill_process_tree(pid_to_kill)
-                window['-OUTPUT-'].update(LANG.get('status_cancelled', "\nProcess cancelled by user.\n"), append=True)
+                output_log.write(_L.status_cancelled)
             except Exception as e:
-                error_msg = LANG.get('error_cancel', "\nError attempting to cancel process: {}\n")
-                window['-OUTPUT-'].update(error_msg.format(e), append=True)
+                error_msg = _L.error_cancel
+                output_log.write(error_msg.format(e))
             finally:
-                if hasattr(window, '_videocr_process_pid'):
-                    del window._videocr_process_pid
+                window._videocr_process_pid = None
         else:
-            window['-OUTPUT-'].update(LANG.get('error_no_process_to_cancel', "\nNo process is currently running to cancel.\n"), append=True)
+            window['-OUTPUT-'].update(_L.error_no_process_to_cancel, append=True)
             window['-BTN-CANCEL-'].update(disabled=True)
             window['-BTN-BATCH-STOP-'].update(disabled=True)
             window['-BTN-RUN-'].update(disabled=not video_path)